@@ -0,0 +1,111 @@
+import os
+import io
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+import contextlib
+
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+from benchmarks import fake_bpy
+bpy = fake_bpy.install()
+
+from script import eg_app
+from benchmarks.scenarios import scenarios
+
+
+baseline_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def execute(function):
+
+    # Run through the operator like the editor does,
+    # and swallow whatever the graph prints
+    from script.operator.exec_main import EGOP_ExecuteMain
+
+    context = type("Context", (), { "active_node": function })()
+    with contextlib.redirect_stdout(io.StringIO()):
+        EGOP_ExecuteMain().execute(context)
+        bpy.app.timers.run_all()
+
+
+def measure(name, repeat):
+    function, operations, *rest = scenarios[name]()
+
+    # Untimed step before every run, like dropping
+    # values a scenario shouldn't reuse
+    prepare = rest[0] if rest else None
+
+    # First run compiles the plan, it is
+    # timed separately from the others
+    start = time.perf_counter()
+    execute(function)
+    first = time.perf_counter() - start
+
+    best = None
+    for _ in range(repeat):
+        if prepare:
+            prepare()
+        start = time.perf_counter()
+        execute(function)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    if prepare:
+        prepare()
+    tracemalloc.start()
+    execute(function)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "operations": operations,
+        "first": first,
+        "best": best,
+        "ops_per_sec": operations / best if best else 0.0,
+        "peak_kib": peak / 1024,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Measure the graph executor with a stand-in bpy")
+    parser.add_argument("scenarios", nargs="*", help=f"Scenarios to run, one of {', '.join(scenarios)}")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per scenario, the best one counts")
+    parser.add_argument("--save", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--preference", action="append", default=[], metavar="NAME=JSON", help="Set an add-on preference before running")
+    options = parser.parse_args(argv)
+
+    eg_app.register()
+
+    from script.base.library import get_preference
+    for item in options.preference:
+        name, value = item.split("=", 1)
+        setattr(get_preference(), name, json.loads(value))
+
+    baseline = {}
+    if os.path.exists(baseline_path):
+        with open(baseline_path) as file:
+            baseline = json.load(file)
+
+    results = {}
+    print(f"{'scenario':<22}{'ops/sec':>14}{'best s':>10}{'first s':>10}{'peak KiB':>12}{'vs base':>10}")
+    for name in options.scenarios or scenarios:
+        result = results[name] = measure(name, options.repeat)
+
+        base = baseline.get(name)
+        ratio = f"{result['ops_per_sec'] / base['ops_per_sec']:.2f}x" if base else "-"
+        print(f"{name:<22}{result['ops_per_sec']:>14,.0f}{result['best']:>10.3f}{result['first']:>10.3f}{result['peak_kib']:>12,.0f}{ratio:>10}")
+
+    if options.save:
+        baseline.update(results)
+        with open(baseline_path, "w") as file:
+            json.dump(baseline, file, indent=2)
+        print(f"Baseline saved to {baseline_path}")
+
+
+if __name__ == "__main__":
+    main()
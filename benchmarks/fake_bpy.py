@@ -0,0 +1,538 @@
+# Minimal pure python stand-in for the parts of bpy the add-on uses,
+# enough to register every class and execute graphs outside blender
+
+import sys
+import types
+
+
+class _Property:
+
+    def __init__(self, kind, **options):
+        self.kind = kind
+        self.options = options
+        self.identifier = None
+
+    def default(self):
+        if "default" in self.options:
+            return self.options["default"]
+        if self.kind == "EnumProperty":
+            items = self.options.get("items")
+            if callable(items) or not items:
+                return ""
+            return items[0][0]
+        return {
+            "BoolProperty": False,
+            "IntProperty": 0,
+            "FloatProperty": 0.0,
+            "StringProperty": "",
+            "FloatVectorProperty": (0.0,) * self.options.get("size", 3),
+        }.get(self.kind)
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return instance.__dict__.setdefault("_rna", {}).get(self.identifier, self.default())
+
+    def __set__(self, instance, value):
+        instance.__dict__.setdefault("_rna", {})[self.identifier] = value
+        update = self.options.get("update")
+        if update:
+            update(instance, context)
+
+
+def _property(kind):
+    def create(**options):
+        return _Property(kind, **options)
+    create.__name__ = kind
+    return create
+
+
+class _RNAMeta(type):
+
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        for identifier, value in namespace.get("__annotations__", {}).items():
+            if isinstance(value, _Property):
+                value.identifier = identifier
+                setattr(cls, identifier, value)
+
+
+class bpy_struct(metaclass=_RNAMeta):
+
+    def as_pointer(self):
+        return id(self)
+
+
+class _Collection(list):
+
+    def get(self, name, default=None):
+        for item in self:
+            if item.name == name:
+                return item
+        return default
+
+    def __hash__(self):
+        return id(self)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            item = self.get(key)
+            if item is None:
+                raise KeyError(key)
+            return item
+        return list.__getitem__(self, key)
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return self.get(key) is not None
+        return list.__contains__(self, key)
+
+
+class NodeSocket(bpy_struct):
+
+    bl_idname = "NodeSocket"
+
+    def __init__(self):
+        self.name = ""
+        self.identifier = ""
+        self.node = None
+        self.is_output = False
+        self.link_limit = 1
+        self.hide_value = False
+        self.display_shape = "CIRCLE"
+
+    @property
+    def links(self):
+        tree = self.node.id_data
+        return tuple(link for link in tree.links if link.from_socket is self or link.to_socket is self)
+
+    @property
+    def is_linked(self):
+        return bool(self.links)
+
+
+class NodeSocketStandard(NodeSocket):
+    pass
+
+
+_socket_defaults = {
+    "NodeSocketInt": 0,
+    "NodeSocketFloat": 0.0,
+    "NodeSocketBool": False,
+    "NodeSocketString": "",
+    "NodeSocketVector": (0.0, 0.0, 0.0),
+    "NodeSocketVectorXYZ": (0.0, 0.0, 0.0),
+    "NodeSocketVectorEuler": (0.0, 0.0, 0.0),
+    "NodeSocketColor": (1.0, 1.0, 1.0, 1.0),
+}
+
+
+class _BuiltinSocket(NodeSocketStandard):
+
+    def __init__(self, default):
+        super().__init__()
+        self.default_value = default
+
+
+class _Sockets(_Collection):
+
+    def __init__(self, node, is_output):
+        super().__init__()
+        self.node = node
+        self.is_output = is_output
+
+    def new(self, socket_type, name):
+        if socket_type in _socket_defaults:
+            socket = _BuiltinSocket(_socket_defaults[socket_type])
+        else:
+            socket = _registry[socket_type]()
+        socket.bl_idname = socket_type
+        socket.name = name
+        socket.identifier = name
+        socket.node = self.node
+        socket.is_output = self.is_output
+        self.append(socket)
+        return socket
+
+    def remove(self, socket):
+        tree = self.node.id_data
+        for link in list(tree.links):
+            if link.from_socket is socket or link.to_socket is socket:
+                tree.links.remove(link)
+        list.remove(self, socket)
+
+
+class Node(bpy_struct):
+
+    bl_idname = "Node"
+    bl_label = "Node"
+
+    def __init__(self, tree, name):
+        self.id_data = tree
+        self.name = name
+        self.label = ""
+        self.color = (0.0, 0.0, 0.0)
+        self.use_custom_color = False
+        self.inputs = _Sockets(self, False)
+        self.outputs = _Sockets(self, True)
+
+    def __repr__(self):
+        return f"<Node {self.name}>"
+
+
+class NodeLink:
+
+    def __init__(self, from_socket, to_socket):
+        self.from_socket = from_socket
+        self.to_socket = to_socket
+        self.from_node = from_socket.node
+        self.to_node = to_socket.node
+        self.is_valid = True
+        self.is_muted = False
+
+
+class _Links(list):
+
+    def __init__(self, tree):
+        super().__init__()
+        self.tree = tree
+
+    def new(self, from_socket, to_socket):
+        link = NodeLink(from_socket, to_socket)
+        self.append(link)
+        self.tree.update()
+        return link
+
+    def remove(self, link):
+        list.remove(self, link)
+        self.tree.update()
+
+
+class _Nodes(_Collection):
+
+    def __init__(self, tree):
+        super().__init__()
+        self.tree = tree
+        self.counts = {}
+
+    def new(self, bl_idname):
+        cls = _registry[bl_idname]
+        count = self.counts.get(bl_idname, 0)
+        self.counts[bl_idname] = count + 1
+        node = cls(self.tree, f"{cls.bl_label}.{count:03d}" if count else cls.bl_label)
+        self.append(node)
+        node.init(context)
+        self.tree.update()
+        return node
+
+    def remove(self, node):
+        for link in list(self.tree.links):
+            if link.from_node is node or link.to_node is node:
+                list.remove(self.tree.links, link)
+        if hasattr(node, "free"):
+            node.free()
+        list.remove(self, node)
+        self.tree.update()
+
+
+class ID(bpy_struct):
+
+    id_type = "OBJECT"
+
+    def __init__(self, name=""):
+        self.name = name
+        self.session_uid = id(self)
+
+    def update_tag(self, refresh=None):
+        pass
+
+
+class NodeTree(ID):
+
+    bl_idname = "NodeTree"
+    id_type = "NODETREE"
+
+    def __init__(self, name="NodeTree"):
+        super().__init__(name)
+        self.nodes = _Nodes(self)
+        self.links = _Links(self)
+
+    def update(self):
+        pass
+
+    def update_tag(self):
+        self.update()
+
+
+class Object(ID):
+
+    def __init__(self, name, object_type="MESH", parent=None):
+        super().__init__(name)
+        self.type = object_type
+        self.parent = parent
+        self.location = (0.0, 0.0, 0.0)
+        self.rotation_euler = (0.0, 0.0, 0.0)
+        self.scale = (1.0, 1.0, 1.0)
+        self.dimensions = (2.0, 2.0, 2.0)
+        self.hide_viewport = False
+        self.hide_render = False
+        self.data = None
+        self.modifiers = []
+
+    @property
+    def children(self):
+        return [obj for obj in data.objects if obj.parent is self]
+
+    def select_set(self, state):
+        pass
+
+
+class _IDCollection(_Collection):
+
+    def __init__(self, factory=None):
+        super().__init__()
+        self.factory = factory
+        self.names = {}
+
+    def new(self, name, *args):
+        item = self.factory(name, *args)
+        self.append(item)
+        return item
+
+    def append(self, item):
+        list.append(self, item)
+        self.names[item.name] = item
+
+    def get(self, name, default=None):
+        return self.names.get(name, default)
+
+    def clear(self):
+        list.clear(self)
+        self.names.clear()
+
+    def remove(self, item, do_unlink=True):
+        list.remove(self, item)
+        if self.names.get(item.name) is item:
+            del self.names[item.name]
+
+    def foreach_get(self, attribute, buffer):
+        index = 0
+        for item in self:
+            for value in getattr(item, attribute):
+                buffer[index] = value
+                index += 1
+
+    def foreach_set(self, attribute, buffer):
+        index = 0
+        for item in self:
+            size = len(getattr(item, attribute))
+            setattr(item, attribute, tuple(buffer[index:index + size]))
+            index += size
+
+
+class Operator(bpy_struct):
+
+    def report(self, level, message):
+        print(*level, message)
+
+
+class AddonPreferences(bpy_struct):
+    pass
+
+
+class Panel(bpy_struct):
+    pass
+
+
+class PropertyGroup(bpy_struct):
+    pass
+
+
+class Text(ID):
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.body = ""
+
+    def clear(self):
+        self.body = ""
+
+    def write(self, text):
+        self.body += text
+
+
+class _PropertyInfo:
+
+    def __init__(self, identifier):
+        self.identifier = identifier
+        self.name = identifier.title()
+
+
+class _RNAInfo:
+
+    def __init__(self, properties):
+        self.properties = properties
+
+
+class Modifier(bpy_struct):
+    bl_rna = _RNAInfo({"type": types.SimpleNamespace(enum_items=[_PropertyInfo("ARRAY"), _PropertyInfo("BEVEL")])})
+
+
+_registry = {}
+
+
+def register_class(cls):
+    _registry[getattr(cls, "bl_idname", cls.__name__)] = cls
+
+
+def unregister_class(cls):
+    _registry.pop(getattr(cls, "bl_idname", cls.__name__), None)
+
+
+class _Timers:
+
+    def __init__(self):
+        self.queue = []
+
+    def register(self, function, first_interval=0.0, persistent=False):
+        self.queue.append((function, first_interval))
+
+    def is_registered(self, function):
+        return any(entry[0] is function for entry in self.queue)
+
+    def unregister(self, function):
+        self.queue = [entry for entry in self.queue if entry[0] is not function]
+
+    def run_all(self):
+        """Drive registered timers until none are left, ignoring their intervals"""
+        while self.queue:
+            function, _ = self.queue.pop(0)
+            interval = function()
+            if interval is not None:
+                self.queue.append((function, interval))
+
+
+def persistent(function):
+    return function
+
+
+class _Ops:
+
+    def __init__(self, path=""):
+        self.path = path
+
+    def __getattr__(self, name):
+        return _Ops(f"{self.path}.{name}" if self.path else name)
+
+    def __call__(self, *args, **kwargs):
+        return {"FINISHED"}
+
+
+class _Addon:
+
+    def __init__(self, preferences):
+        self.preferences = preferences
+
+
+class _Addons(dict):
+
+    def __missing__(self, key):
+        addon = _Addon(_registry_preferences())
+        self[key] = addon
+        return addon
+
+
+def _registry_preferences():
+    for cls in _registry.values():
+        if isinstance(cls, type) and issubclass(cls, AddonPreferences):
+            return cls()
+    return types.SimpleNamespace()
+
+
+bpy = types.ModuleType("bpy")
+props = types.ModuleType("bpy.props")
+for _kind in ("BoolProperty", "FloatProperty", "EnumProperty", "StringProperty", "IntProperty",
+              "PointerProperty", "CollectionProperty", "FloatVectorProperty"):
+    setattr(props, _kind, _property(_kind))
+
+bpy_types = types.ModuleType("bpy.types")
+for _cls in (bpy_struct, Node, NodeSocket, NodeSocketStandard, NodeTree, ID, Object, Operator,
+             AddonPreferences, Panel, PropertyGroup, Text, Modifier):
+    setattr(bpy_types, _cls.__name__, _cls)
+
+data = types.SimpleNamespace(
+    objects=_IDCollection(Object),
+    node_groups=_IDCollection(lambda name, bl_idname: _registry[bl_idname](name)),
+    texts=_IDCollection(Text),
+    lights=_IDCollection(),
+    filepath="",
+    batch_remove=lambda ids: [data.objects.remove(item) for item in list(ids)],
+    orphans_purge=lambda **kwargs: 0,
+)
+
+context = types.SimpleNamespace(
+    preferences=types.SimpleNamespace(addons=_Addons()),
+    workspace=None,
+    window_manager=None,
+    view_layer=types.SimpleNamespace(objects=types.SimpleNamespace(active=None), update=lambda: None),
+    collection=types.SimpleNamespace(objects=types.SimpleNamespace(link=lambda obj: data.objects.append(obj))),
+)
+
+app = types.SimpleNamespace(
+    timers=_Timers(),
+    handlers=types.SimpleNamespace(
+        load_post=[], undo_post=[], redo_post=[], depsgraph_update_post=[], persistent=persistent
+    ),
+    background=True,
+)
+
+utils = types.SimpleNamespace(register_class=register_class, unregister_class=unregister_class)
+path = types.SimpleNamespace(abspath=lambda value: value.replace("//", ""), basename=lambda value: value)
+
+bpy.types = bpy_types
+bpy.props = props
+bpy.data = data
+bpy.context = context
+bpy.app = app
+bpy.utils = utils
+bpy.ops = _Ops()
+bpy.path = path
+
+
+class _Stub:
+
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+
+def _module(name, **attributes):
+    module = types.ModuleType(name)
+    for key, value in attributes.items():
+        setattr(module, key, value)
+    return module
+
+
+def install():
+    """Register the stand-in modules so the add-on sources can be imported without Blender"""
+    handlers = _module("bpy.app.handlers", persistent=persistent)
+    sys.modules.update({
+        "bpy": bpy,
+        "bpy.props": props,
+        "bpy.types": bpy_types,
+        "bpy.app": _module("bpy.app", handlers=handlers),
+        "bpy.app.handlers": handlers,
+        "bpy.ops": bpy.ops,
+        "bpy_extras": _module("bpy_extras"),
+        "bpy_extras.io_utils": _module("bpy_extras.io_utils", ImportHelper=object),
+        "mathutils": _module("mathutils"),
+        "nodeitems_utils": _module(
+            "nodeitems_utils",
+            NodeCategory=_Stub,
+            NodeItem=_Stub,
+            register_node_categories=lambda *args: None,
+            unregister_node_categories=lambda *args: None,
+        ),
+    })
+    bpy.app.handlers = app.handlers
+    return bpy
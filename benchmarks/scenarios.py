@@ -0,0 +1,135 @@
+import bpy
+
+from script.base.cache import cache_store
+from script.base.objects import OBJECT_LIST
+
+
+def create_tree(name):
+    tree = bpy.data.node_groups.get(name)
+    if tree:
+        bpy.data.node_groups.remove(tree)
+    return bpy.data.node_groups.new(name, "eg_nodetree")
+
+
+def link(tree, from_node, from_name, to_node, to_name):
+    tree.links.new(from_node.outputs[from_name], to_node.inputs[to_name])
+
+
+def sequence_chain(size=10000):
+    """Deep chain of sequence nodes, one exec dispatch per node"""
+
+    tree = create_tree("bench_sequence")
+    function = tree.nodes.new("egn_python_function")
+
+    previous, name = function, "exec"
+    for _ in range(size):
+        sequence = tree.nodes.new("egn_python_sequence")
+        link(tree, previous, name, sequence, "exec")
+        previous, name = sequence, "exec 1"
+
+    return function, size
+
+
+def for_loop(size=100000):
+    """Loop with an empty body, cost of a single iteration"""
+
+    tree = create_tree("bench_loop")
+    function = tree.nodes.new("egn_python_function")
+    loop = tree.nodes.new("egn_python_for_loop")
+    loop.inputs["end"].default_value = size
+    link(tree, function, "exec", loop, "exec")
+
+    body = tree.nodes.new("egn_python_sequence")
+    link(tree, loop, "loop", body, "exec")
+
+    return function, size
+
+
+def map_merge(width=64, size=1000):
+    """Many maps merged into one on every iteration, cost of value pulls"""
+
+    tree = create_tree("bench_merge")
+    function = tree.nodes.new("egn_python_function")
+    loop = tree.nodes.new("egn_python_for_loop")
+    loop.inputs["end"].default_value = size
+    link(tree, function, "exec", loop, "exec")
+
+    merge = tree.nodes.new("egn_python_map_merge")
+    for index in range(width):
+        make = tree.nodes.new("egn_python_make_map")
+        make.inputs["key"].default_value = f"key_{index}"
+        link(tree, loop, "index", make, "value")
+        link(tree, make, "map", merge, "maps")
+
+    store = tree.nodes.new("egn_python_cache_set")
+    store.inputs["name"].default_value = "merged"
+    link(tree, merge, "map", store, "value")
+    link(tree, loop, "loop", store, "exec")
+
+    return function, size * width
+
+
+def build_filter(size):
+
+    bpy.data.objects.clear()
+    kinds = ("MESH", "EMPTY", "LIGHT", "CAMERA")
+    for index in range(size):
+        bpy.data.objects.new(f"Object_{index}", kinds[index % len(kinds)])
+
+    tree = create_tree("bench_filter")
+    function = tree.nodes.new("egn_python_function")
+    fetch = tree.nodes.new("egn_object_get_all")
+    link(tree, function, "exec", fetch, "exec")
+
+    filter = tree.nodes.new("egn_object_filter")
+    filter.prop_type = "MESH"
+    link(tree, fetch, "exec", filter, "exec")
+    link(tree, fetch, "object Ids", filter, "object Ids")
+
+    return function
+
+
+def filter_objects(size=50000):
+    """Filter a large scene by object type"""
+
+    # Object lists are kept until the scene changes,
+    # drop them so every run filters again
+    return build_filter(size), size, lambda: cache_store.invalidate((OBJECT_LIST,))
+
+
+def filter_objects_kept(size=50000):
+    """Filter a large scene which didn't change since the last run"""
+
+    return build_filter(size), size
+
+
+def bulk_locations(size=50000):
+    """Move every object of a large scene with one bulk write"""
+
+    bpy.data.objects.clear()
+    for index in range(size):
+        bpy.data.objects.new(f"Object_{index}")
+
+    tree = create_tree("bench_bulk")
+    function = tree.nodes.new("egn_python_function")
+    fetch = tree.nodes.new("egn_object_get_all")
+    link(tree, function, "exec", fetch, "exec")
+
+    write = tree.nodes.new("egn_object_set_locations")
+    write.inputs["vector"].default_value = (1.0, 2.0, 3.0)
+    link(tree, fetch, "exec", write, "exec")
+    link(tree, fetch, "object Ids", write, "objects")
+
+    return function, size
+
+
+# name -> builder returning the root function node, the number
+# of operations a run performs and optionally a step run before it
+scenarios = {
+    "sequence_chain": sequence_chain,
+    "for_loop": for_loop,
+    "map_merge": map_merge,
+    "filter_objects": filter_objects,
+    "filter_objects_kept": filter_objects_kept,
+    "bulk_locations": bulk_locations,
+}
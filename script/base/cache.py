@@ -0,0 +1,285 @@
+import sys
+import time
+from collections import OrderedDict
+
+
+def estimate_size(value, sample=100):
+
+    # Shallow size plus a sampled size of container
+    # items, good enough to keep memory bounded
+    size = sys.getsizeof(value)
+
+    if isinstance(value, dict):
+        items = list(value.items())
+        if items:
+            sampled = items[:sample]
+            item_size = sum(sys.getsizeof(key) + sys.getsizeof(item) for key, item in sampled)
+            size += item_size * len(items) // len(sampled)
+
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = value if isinstance(value, (list, tuple)) else list(value)
+        if items:
+            sampled = items[:sample]
+            item_size = sum(sys.getsizeof(item) for item in sampled)
+            size += item_size * len(items) // len(sampled)
+
+    return size
+
+
+class EG_CacheEntry:
+    """Value stored in the cache with its bookkeeping"""
+
+    __slots__ = ("value", "size", "expires", "pinned", "depends")
+
+    def __init__(self, value, size, expires, pinned, depends=()):
+        self.value = value
+        self.size = size
+        self.expires = expires
+        self.pinned = pinned
+        self.depends = depends
+
+
+class EG_CacheStats:
+    """Usage counters of a single cache key"""
+
+    __slots__ = ("hits", "misses", "evictions", "inserts", "size")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.inserts = 0
+        self.size = 0
+
+    def add(self, other):
+        self.hits += other.hits
+        self.misses += other.misses
+        self.evictions += other.evictions
+        self.inserts += other.inserts
+        self.size += other.size
+
+
+class EG_CacheStore:
+    """Bounded least recently used store with per entry expiry and pinning"""
+
+    def __init__(self, max_entries=10000, max_bytes=256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        # (namespace, name) -> entry, least recently used first
+        self.entries = OrderedDict()
+        self.size = 0
+
+        # ID type like "OBJECT" or (ID type, name) -> keys
+        # of entries which are stale once it changes
+        self.dependents = {}
+
+        # (namespace, name) -> counters, kept after the entry is gone
+        self.stats = {}
+        self.started = time.monotonic()
+
+    def get_stats(self, key):
+        stats = self.stats.get(key)
+        if stats is None:
+            # Forget counters of removed keys instead
+            # of growing with every unique name
+            if len(self.stats) >= self.max_entries * 2:
+                self.stats = { key: value for key, value in self.stats.items() if key in self.entries }
+            stats = self.stats[key] = EG_CacheStats()
+        return stats
+
+    def reset_stats(self):
+        self.stats = {}
+        self.started = time.monotonic()
+
+    def configure(self, max_entries, max_bytes):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.evict()
+
+    def set(self, name, value, namespace="user", pinned=False, ttl=0.0, depends=()):
+        key = (namespace, name)
+        self.discard(key)
+
+        expires = time.monotonic() + ttl if ttl > 0 else 0.0
+        entry = EG_CacheEntry(value, estimate_size(value), expires, pinned, tuple(depends))
+
+        self.entries[key] = entry
+        self.size += entry.size
+
+        for depend in entry.depends:
+            self.dependents.setdefault(depend, set()).add(key)
+
+        stats = self.get_stats(key)
+        stats.inserts += 1
+        stats.size = entry.size
+
+        self.evict()
+
+    def get(self, name, namespace="user", default=None):
+        key = (namespace, name)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.get_stats(key).misses += 1
+            return default
+
+        if entry.expires and entry.expires <= time.monotonic():
+            self.evict_key(key)
+            self.get_stats(key).misses += 1
+            return default
+
+        self.entries.move_to_end(key)
+        self.get_stats(key).hits += 1
+        return entry.value
+
+    def remove(self, name, namespace="user"):
+        self.discard((namespace, name))
+
+    def discard(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+            for depend in entry.depends:
+                keys = self.dependents.get(depend)
+                if keys:
+                    keys.discard(key)
+                    if not keys:
+                        del self.dependents[depend]
+
+            stats = self.stats.get(key)
+            if stats:
+                stats.size = 0
+        return entry
+
+    def evict_key(self, key):
+        if self.discard(key):
+            self.get_stats(key).evictions += 1
+
+    def invalidate(self, changed):
+        """Evict entries depending on any of the changed ID types or datablocks"""
+
+        keys = set()
+        for depend in changed:
+            keys.update(self.dependents.get(depend, ()))
+
+        for key in keys:
+            self.evict_key(key)
+
+    def clear(self, namespace=None):
+        if namespace is None:
+            self.entries.clear()
+            self.dependents.clear()
+            self.size = 0
+            self.reset_stats()
+            return
+
+        for key in [key for key in self.entries if key[0] == namespace]:
+            self.discard(key)
+
+    def expire(self):
+        now = time.monotonic()
+        for key in [key for key, entry in self.entries.items() if entry.expires and entry.expires <= now]:
+            self.evict_key(key)
+
+    def is_full(self):
+        return len(self.entries) > self.max_entries or self.size > self.max_bytes
+
+    def evict(self):
+        if not self.is_full():
+            return
+
+        # Expired entries go first, then least recently
+        # used ones, pinned entries are never evicted
+        self.expire()
+        if not self.is_full():
+            return
+
+        for key in [key for key, entry in self.entries.items() if not entry.pinned]:
+            self.evict_key(key)
+            if not self.is_full():
+                break
+
+    def items(self, namespace=None):
+        now = time.monotonic()
+        for (entry_namespace, name), entry in list(self.entries.items()):
+            if namespace is not None and entry_namespace != namespace:
+                continue
+            if entry.expires and entry.expires <= now:
+                continue
+            yield name, entry.value
+
+    def summary(self):
+        """Counters per namespace and per key, with insert rate per second"""
+
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        namespaces = {}
+        keys = []
+
+        for key, stats in self.stats.items():
+            total = namespaces.get(key[0])
+            if total is None:
+                total = namespaces[key[0]] = EG_CacheStats()
+            total.add(stats)
+            keys.append((key, stats))
+
+        return namespaces, keys, elapsed
+
+    def __len__(self):
+        return len(self.entries)
+
+
+cache_store = EG_CacheStore()
+
+
+def get_frame_sizes(frame):
+
+    # Approximate size of node data held by
+    # a running frame, largest first
+    nodes = { slot: node for node, slot in frame.slots.items() }
+    if frame.plan:
+        nodes.update({ entry.index: entry.node for entry in frame.plan.nodes })
+
+    sizes = []
+    for slot, values in enumerate(frame.values):
+        if values:
+            size = sum(estimate_size(value) for value in values.values())
+            sizes.append((nodes[slot].name if slot in nodes else str(slot), size))
+
+    sizes.sort(key=lambda row: row[1], reverse=True)
+    return sizes
+
+
+def format_size(size):
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def describe_cache(store, frame=None, limit=10):
+    """Readable top N summary of the store and the node data of a frame"""
+
+    namespaces, keys, elapsed = store.summary()
+    lines = [f"Cache: {len(store)} entries, {format_size(store.size)} of {format_size(store.max_bytes)}"]
+
+    for namespace, stats in sorted(namespaces.items()):
+        lines.append(
+            f"  [{namespace}] size {format_size(stats.size)}, hits {stats.hits}, misses {stats.misses}, "
+            f"evictions {stats.evictions}, inserts {stats.inserts / elapsed:.1f}/s"
+        )
+
+    keys.sort(key=lambda row: row[1].size, reverse=True)
+    for (namespace, name), stats in keys[:limit]:
+        lines.append(
+            f"  {namespace}/{name}: {format_size(stats.size)}, hits {stats.hits}, misses {stats.misses}, evictions {stats.evictions}"
+        )
+
+    if frame:
+        sizes = get_frame_sizes(frame)
+        lines.append(f"Node data: {len(sizes)} nodes, {format_size(sum(size for _, size in sizes))}")
+        for name, size in sizes[:limit]:
+            lines.append(f"  {name}: {format_size(size)}")
+
+    return "\n".join(lines)
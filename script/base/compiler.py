@@ -0,0 +1,413 @@
+from ..socket.derived import EGS_Execute, EGS_Callback
+from .tree import get_topology, get_property_names
+from .frame import EG_ExecutionFrame, active_frame, frame_stack
+from .profiler import profiler
+from .tracer import tracer
+from .cache import cache_store
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+exec_sockets = { EGS_Execute.bl_idname, EGS_Callback.bl_idname }
+
+# Values copied before they are handed out, arrays of
+# bulk nodes are changed in place like lists
+mutable_types = (list, dict, set, numpy.ndarray) if numpy else (list, dict, set)
+
+
+class EG_CompiledNode:
+    """Node lowered into pre-resolved links and bound methods"""
+
+    __slots__ = ("index", "node", "run", "next", "previous", "links", "pull", "pulls", "depends")
+
+    def __init__(self, index, node):
+        self.index = index
+        self.node = node
+        self.run = getattr(node, "__execute__", None)
+
+        # exec socket name -> compiled target node
+        self.next = {}
+        self.previous = {}
+
+        # input socket name -> [(compiled source node, source socket name)]
+        self.links = {}
+
+        # input socket name -> closure returning its value
+        self.pull = {}
+        self.pulls = {}
+
+        # indices of epochs that can change the outputs of this node
+        self.depends = ()
+
+
+class EG_Plan:
+    """Flat list of compiled nodes reachable from a root node"""
+
+    def __init__(self, tree, root):
+        self.tree = tree
+        self.root = root
+        self.nodes = []
+        self.entries = {}
+        self.bindings = {}
+
+        # Runs of this plan are recorded by the tracer
+        self.trace = False
+
+        # Indices of nodes each node reads from, resolved
+        # by the first incremental run
+        self.sources = None
+
+
+def copy_value(value):
+    # Hand out copies of containers so consumers which
+    # mutate their input don't change the memoized value
+    if isinstance(value, mutable_types):
+        return value.copy()
+    return value
+
+
+def create_constant(value):
+
+    # Copy RNA arrays so the plan doesn't keep
+    # reading through the socket
+    if not isinstance(value, (str, int, float, bool)) and value is not None:
+        try:
+            value = tuple(value)
+        except TypeError:
+            pass
+
+    return lambda: value
+
+
+def create_folded(value):
+    if isinstance(value, mutable_types):
+        return lambda: value.copy()
+    return create_constant(value)
+
+
+def create_memo(plan, key, depends, method):
+
+    def memoized():
+        frame = frame_stack[-1]
+        memo = frame.memo
+        epochs = frame.epochs
+
+        # Stamp only grows when a node this value
+        # depends on executes or advances a loop
+        stamp = 0
+        for index in depends:
+            stamp += epochs[index]
+
+        cached = memo.get(key)
+        if cached is not None and cached[0] == stamp:
+            return copy_value(cached[1])
+
+        value = method()
+        memo[key] = (stamp, value)
+        return copy_value(value)
+
+    return memoized
+
+
+class EG_Unhashable(Exception):
+    """Value can't be part of a memo key"""
+
+
+def freeze_value(value):
+
+    # Hashable copy tagged with the type, so 1, 1.0
+    # and True don't share a result
+    kind = type(value)
+    if value is None or kind in (bool, int, float, str, bytes):
+        return (kind, value)
+
+    if kind in (list, tuple):
+        return (kind, tuple(freeze_value(item) for item in value))
+
+    if kind is dict:
+        return (kind, tuple((freeze_value(key), freeze_value(item)) for key, item in value.items()))
+
+    if kind in (set, frozenset):
+        return (kind, frozenset(freeze_value(item) for item in value))
+
+    # RNA arrays and vectors read from sockets
+    try:
+        return (kind.__name__, tuple(freeze_value(item) for item in value))
+    except TypeError:
+        raise EG_Unhashable(kind.__name__)
+
+
+def create_persisted(entry, socket_name, method):
+
+    node = entry.node
+    label = f"{node.bl_idname}.{socket_name}"
+    missing = object()
+
+    # Properties don't change while a run goes,
+    # they are frozen once per run
+    frozen = [None, None]
+
+    def persisted():
+        pull, pulls = entry.pull, entry.pulls
+        inputs = { name: [binding() for binding in bindings] for name, bindings in pulls.items() }
+
+        # Same node type, properties and input values
+        # give the same result in any run or tree
+        try:
+            run_id = frame_stack[-1].run_id if frame_stack else None
+            if frozen[0] != run_id or run_id is None:
+                frozen[:] = run_id, tuple(freeze_value(getattr(node, name)) for name in get_property_names(node))
+
+            key = (label, frozen[1], tuple((name, freeze_value(values)) for name, values in inputs.items()))
+        except EG_Unhashable:
+            return method()
+
+        # Stored under a short name, with the full key
+        # kept beside the value in case hashes collide
+        cache_name = f"{label}:{hash(key) & 0xFFFFFFFFFFFFFFFF:016x}"
+        cached = cache_store.get(cache_name, namespace="memo", default=missing)
+        if cached is not missing and cached[0] == key:
+            return copy_value(cached[1])
+
+        # Serve the inputs pulled for the key, so
+        # upstream nodes are not evaluated twice
+        entry.pull = { name: create_folded(inputs[name][0]) for name in pull }
+        entry.pulls = { name: [create_folded(value) for value in values] for name, values in inputs.items() }
+        try:
+            value = method()
+        finally:
+            entry.pull, entry.pulls = pull, pulls
+
+        cache_store.set(cache_name, (key, value), namespace="memo")
+        return copy_value(value)
+
+    return persisted
+
+
+def is_persistable(node):
+    return getattr(node, "memoize", False) and getattr(node, "persist", True) and not getattr(node, "reads_scene", False)
+
+
+def get_binding(plan, source, socket_name, memoize, persist=False):
+
+    # Get bound method of the source node
+    # else return None
+    key = (source.index, socket_name)
+    if key in plan.bindings:
+        return plan.bindings[key]
+
+    method = getattr(source.node, f"on_{socket_name.replace(' ', '_')}", None)
+    if not callable(method):
+        method = None
+
+    elif memoize and getattr(source.node, "memoize", False):
+        if persist and is_persistable(source.node):
+            method = create_persisted(source, socket_name, method)
+        method = create_memo(plan, key, source.depends, method)
+
+    plan.bindings[key] = method
+    return method
+
+
+def resolve_depends(plan):
+
+    world = len(plan.nodes)
+    resolved = {}
+
+    def visit(entry, trail):
+        if entry.index in resolved:
+            return resolved[entry.index]
+
+        # Impure nodes change their outputs when executed, pure nodes
+        # which are not memoizable or read the scene may change anytime
+        depends = set()
+        if hasattr(entry.node, "__execute__"):
+            depends.add(entry.index)
+        elif getattr(entry.node, "reads_scene", False) or not getattr(entry.node, "memoize", False):
+            depends.add(world)
+
+        trail.add(entry.index)
+        for links in entry.links.values():
+            for source, _ in links:
+                if source.index not in trail:
+                    depends |= visit(source, trail)
+        trail.discard(entry.index)
+
+        resolved[entry.index] = depends
+        return depends
+
+    for entry in plan.nodes:
+        entry.depends = tuple(sorted(visit(entry, set())))
+
+
+def resolve_constants(plan):
+
+    resolved = {}
+
+    def visit(entry):
+        if entry.index in resolved:
+            return resolved[entry.index]
+
+        # Assume not constant while visiting, so
+        # cycles are never folded
+        resolved[entry.index] = False
+
+        node = entry.node
+        if hasattr(node, "__execute__") or getattr(node, "reads_scene", False) or not getattr(node, "memoize", False):
+            return False
+
+        # Node is constant if every linked input comes
+        # from a constant node, others are default values
+        for links in entry.links.values():
+            for source, _ in links:
+                if not visit(source):
+                    return False
+
+        resolved[entry.index] = True
+        return True
+
+    return { entry.index for entry in plan.nodes if visit(entry) }
+
+
+def fold_constants(plan):
+
+    constants = resolve_constants(plan)
+    if not constants:
+        return
+
+    # Evaluate constant outputs once inside a throwaway
+    # frame and bind their consumers to the result
+    frame_stack.append(EG_ExecutionFrame(plan))
+    try:
+        for key, method in plan.bindings.items():
+            if key[0] in constants and method:
+                try:
+                    plan.bindings[key] = create_folded(method())
+                except Exception:
+                    # Leave it to fail at run time
+                    pass
+    finally:
+        frame_stack.pop()
+
+
+def instrument_plan(plan, monitor):
+
+    # Swap in timed dispatch and pulls, plans
+    # compiled without monitors pay nothing
+    for entry in plan.nodes:
+        if entry.run:
+            entry.run = monitor.wrap_run(entry.node, entry.run)
+
+    for key, method in plan.bindings.items():
+        if method:
+            plan.bindings[key] = monitor.wrap_pull(plan.nodes[key[0]].node, key[1], method)
+
+
+def bind_links(plan, memoize, persist=False):
+    for entry in plan.nodes:
+        for name, links in entry.links.items():
+            bindings = [get_binding(plan, source, socket_name, memoize, persist) for source, socket_name in links]
+
+            if bindings[0]:
+                entry.pull[name] = bindings[0]
+            entry.pulls[name] = [binding for binding in bindings if binding]
+
+
+def compile_plan(root, memoize=False, profile=False, trace=False, persist=False):
+
+    plan = EG_Plan(root.id_data, root)
+    topology = get_topology(plan.tree)
+    pending = []
+
+    def get_entry(node):
+        entry = plan.entries.get(node)
+        if entry is None:
+            entry = EG_CompiledNode(len(plan.nodes), node)
+            plan.nodes.append(entry)
+            plan.entries[node] = entry
+            pending.append(entry)
+        return entry
+
+    get_entry(root)
+
+    # Walk the tree once and resolve every link
+    # reachable from the root node
+    while pending:
+        entry = pending.pop()
+        node = entry.node
+
+        # Resolve execution flow, only first link
+        # of an exec socket is followed
+        for socket in node.outputs:
+            if socket.bl_idname in exec_sockets and socket.name not in entry.next:
+                peers = topology.get_outputs(node, socket.name)
+                if peers and hasattr(peers[0][0], "__execute__"):
+                    entry.next[socket.name] = get_entry(peers[0][0])
+
+        for socket in node.inputs:
+            if socket.name in entry.pulls or socket.name in entry.previous:
+                continue
+
+            peers = topology.get_inputs(node, socket.name)
+
+            if socket.bl_idname in exec_sockets:
+                if peers and hasattr(peers[0][0], "__execute__"):
+                    entry.previous[socket.name] = get_entry(peers[0][0])
+                continue
+
+            # Linked sockets are resolved to their source nodes
+            # and others to their default value
+            if peers:
+                entry.links[socket.name] = [
+                    (get_entry(source_node), source_socket.name) for source_node, source_socket in peers
+                ]
+                entry.pulls[socket.name] = []
+
+            elif hasattr(socket, "default_value"):
+                constant = create_constant(socket.default_value)
+                entry.pull[socket.name] = constant
+                entry.pulls[socket.name] = [constant]
+
+            else:
+                entry.pulls[socket.name] = []
+
+    if memoize:
+        resolve_depends(plan)
+
+    # Bind linked sockets to source methods, then once
+    # more after constant outputs replaced their bindings
+    bind_links(plan, memoize, persist)
+    fold_constants(plan)
+
+    if profile:
+        instrument_plan(plan, profiler)
+
+    if trace:
+        instrument_plan(plan, tracer)
+        plan.trace = True
+
+    bind_links(plan, memoize, persist)
+
+    return plan
+
+
+def get_plan(root, memoize=False, profile=False, trace=False, persist=False):
+
+    # Plans live as long as the link snapshot of their
+    # tree, one per root and set of compile options
+    key = (root, memoize, profile, trace, persist)
+    plans = get_topology(root.id_data).plans
+    plan = plans.get(key)
+    if plan is None:
+        plan = compile_plan(root, memoize, profile, trace, persist)
+        plans[key] = plan
+    return plan
+
+
+def active_plan():
+    frame = active_frame()
+    return frame.plan if frame else None
+
@@ -0,0 +1,119 @@
+import os
+import mmap
+import pickle
+import struct
+import hashlib
+import bpy
+
+
+# Files start with the length of the version key
+# followed by the key, the pickled value comes after
+header = struct.Struct("<I")
+
+
+class EG_SafeUnpickler(pickle.Unpickler):
+    """Loads plain python values only, cache files never import anything"""
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"{module}.{name} is not allowed in cache files")
+
+
+class EG_DiskCache:
+    """Cache values in files next to the blend file"""
+
+    suffix = ".egc"
+
+    def get_directory(self):
+
+        # Unsaved files have no place to keep the cache
+        filepath = bpy.data.filepath
+        if not filepath:
+            return None
+
+        folder, name = os.path.split(filepath)
+        return os.path.join(folder, f"{os.path.splitext(name)[0]}_eg_cache")
+
+    def get_path(self, name):
+        directory = self.get_directory()
+        if not directory:
+            return None
+
+        digest = hashlib.sha1(str(name).encode("utf-8")).hexdigest()
+        return os.path.join(directory, digest + self.suffix)
+
+    def write(self, name, value, version=""):
+        path = self.get_path(name)
+        if not path:
+            print("Disk cache needs the blend file to be saved")
+            return False
+
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"Value of {name} can't be stored on disk: {e}")
+            return False
+
+        key = str(version).encode("utf-8")
+
+        # Replace the file at once, so a reader never
+        # sees a half written value
+        temporary = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(temporary, "wb") as file:
+                file.write(header.pack(len(key)))
+                file.write(key)
+                file.write(payload)
+            os.replace(temporary, path)
+
+        except OSError as e:
+            print(f"Disk cache of {name} can't be written: {e}")
+            if os.path.isfile(temporary):
+                try:
+                    os.remove(temporary)
+                except OSError:
+                    pass
+            return False
+
+        return True
+
+    def read(self, name, version=""):
+        """Return (found, value), files of another version are removed"""
+
+        path = self.get_path(name)
+        if not path or not os.path.isfile(path):
+            return False, None
+
+        key = str(version).encode("utf-8")
+        try:
+            with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                length = header.unpack_from(data, 0)[0]
+                start = header.size + length
+
+                if data[header.size:start] != key:
+                    stale = True
+                else:
+                    stale = False
+                    data.seek(start)
+                    value = EG_SafeUnpickler(data).load()
+
+        except (OSError, ValueError, EOFError, struct.error, pickle.UnpicklingError) as e:
+            print(f"Disk cache of {name} can't be read: {e}")
+            return False, None
+
+        if stale:
+            self.remove(name)
+            return False, None
+
+        return True, value
+
+    def remove(self, name):
+        path = self.get_path(name)
+        if path and os.path.isfile(path):
+            try:
+                os.remove(path)
+            except OSError as e:
+                print(f"Disk cache of {name} can't be removed: {e}")
+
+
+disk_cache = EG_DiskCache()
@@ -0,0 +1,185 @@
+import itertools
+
+
+run_ids = itertools.count(1)
+
+
+class EG_CancelToken:
+    """Flag checked by the executor before each node"""
+
+    __slots__ = ("cancelled",)
+
+    def __init__(self):
+        self.cancelled = False
+
+
+class EG_ExecutionFrame:
+    """Runtime state of a single graph execution"""
+
+    __slots__ = ("run_id", "plan", "token", "slots", "values", "memo", "epochs", "deferred", "errors", "replay", "records", "changed", "stale", "objects", "result", "pending", "undo")
+
+    def __init__(self, plan=None, token=None):
+        self.run_id = next(run_ids)
+        self.plan = plan
+
+        # Nested runs share the token of the run
+        # they are called from, so both stop together
+        if token is None:
+            parent = active_frame()
+            token = parent.token if parent else EG_CancelToken()
+        self.token = token
+
+        # slots of nodes which are not part of the plan,
+        # appended after the compiled nodes
+        self.slots = {}
+
+        # node slot -> {output name -> value}
+        size = len(plan.nodes) if plan else 0
+        self.values = [None] * size
+
+        # memo table and epoch counters, last epoch
+        # counts every impure node execution
+        self.memo = {}
+        self.epochs = [0] * (size + 1)
+
+        # (node slot, name) -> write applied once the run ends
+        self.deferred = {}
+
+        # (node name, message) of exceptions raised by nodes
+        self.errors = []
+
+        # Records of the last run nodes may replay, records of this
+        # run and indices of nodes which executed or must execute,
+        # replay is None unless the run is incremental
+        self.replay = None
+        self.records = None
+        self.changed = None
+        self.stale = None
+
+        # Objects by name, built by the first lookup and
+        # dropped whenever the editor ran in between
+        self.objects = None
+
+        # Value given to an output node, and continuations
+        # queued by nodes which didn't run yet
+        self.result = None
+        self.pending = 0
+
+        # Whether nodes changed data the user should be able
+        # to undo, pushed as one step when the run ends
+        self.undo = False
+
+    def get_slot(self, node):
+        entry = self.plan.entries.get(node) if self.plan else None
+        if entry:
+            return entry.index
+
+        slot = self.slots.get(node)
+        if slot is None:
+            slot = len(self.values)
+            self.slots[node] = slot
+            self.values.append(None)
+        return slot
+
+    def get_values(self, node):
+        slot = self.get_slot(node)
+        values = self.values[slot]
+        if values is None:
+            values = self.values[slot] = {}
+        return values
+
+    def set_value(self, node, name, value):
+        self.get_values(node)[name] = value
+
+    def get_value(self, node, name):
+        values = self.values[self.get_slot(node)]
+        return values.get(name) if values else None
+
+    def remove_value(self, node, name):
+        values = self.values[self.get_slot(node)]
+        if values:
+            values.pop(name, None)
+
+    def touch(self, entry):
+        self.epochs[entry.index] += 1
+        self.epochs[-1] += 1
+
+    def defer(self, node, name, write):
+        self.deferred[(self.get_slot(node), name)] = write
+
+    @property
+    def cancelled(self):
+        return self.token.cancelled
+
+    def cancel(self):
+        self.token.cancelled = True
+
+    def release(self):
+
+        # Drop node data and queued writes
+        # of a run which was cancelled
+        self.values = [None] * len(self.values)
+        self.memo.clear()
+        self.deferred.clear()
+
+    def commit(self):
+
+        # Apply writes queued by nodes, later
+        # writes of the same key replace earlier ones
+        deferred = list(self.deferred.values())
+        self.deferred.clear()
+        for write in deferred:
+            try:
+                write()
+            except Exception as e:
+                print(e)
+
+
+frame_stack = []
+
+# Frames of runs which continue from timers
+running_frames = []
+
+# Frame used by nodes evaluated outside of any run
+idle_frame = None
+
+
+def active_frame():
+    return frame_stack[-1] if frame_stack else None
+
+
+def current_frame():
+    global idle_frame
+
+    if frame_stack:
+        return frame_stack[-1]
+
+    if idle_frame is None:
+        idle_frame = EG_ExecutionFrame()
+    return idle_frame
+
+
+def cancel_frames(tree=None, root=None):
+
+    # Stop every run of a tree or a root node,
+    # or all of them if neither is given
+    for frame in frame_stack + running_frames:
+        plan = frame.plan
+        if not plan:
+            continue
+        if tree is not None and plan.tree != tree:
+            continue
+        if root is not None and plan.root != root:
+            continue
+        frame.cancel()
+
+
+def report_error(name, error):
+    frame = active_frame()
+    if frame:
+        frame.errors.append((name, str(error)))
+
+
+def flush_idle_frame():
+    global idle_frame
+    idle_frame = None
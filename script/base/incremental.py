@@ -0,0 +1,141 @@
+from .tree import watch_tree, track_changes, take_dirty
+
+
+class EG_NodeRecord:
+    """Exec outputs fired and node data left by the last execution of a node"""
+
+    __slots__ = ("fired", "values", "count", "replayable")
+
+    def __init__(self):
+        self.fired = []
+        self.values = None
+        self.count = 0
+        self.replayable = True
+
+
+# root node -> {node -> record} of its last finished run
+record_map = {}
+
+
+def flush_records():
+    record_map.clear()
+
+
+def get_sources(plan):
+
+    # Indices of nodes each node reads values from, pure nodes
+    # are followed and impure ones end the walk, as a new
+    # execution of them is noticed while the run goes
+    if plan.sources is not None:
+        return plan.sources
+
+    resolved = {}
+
+    def visit(entry):
+        sources = resolved.get(entry.index)
+        if sources is not None:
+            return sources
+
+        sources = resolved[entry.index] = set()
+        for links in entry.links.values():
+            for source, _ in links:
+                sources.add(source.index)
+                if not hasattr(source.node, "__execute__"):
+                    sources |= visit(source)
+        return sources
+
+    plan.sources = [tuple(visit(entry)) for entry in plan.nodes]
+    return plan.sources
+
+
+def is_volatile(node):
+
+    # Nodes which read the scene, runtime state or keep
+    # state of their own may do something else without any edit
+    if hasattr(node, "__execute__"):
+        return getattr(node, "reads_scene", False) or not getattr(node, "replay", True)
+    return getattr(node, "reads_scene", False) or not getattr(node, "memoize", False)
+
+
+def begin_incremental(frame):
+    """Let nodes of the frame replay their last run unless something they read changed"""
+
+    plan = frame.plan
+    track_changes(plan.tree)
+    dirty = take_dirty(plan.tree)
+    watch_tree(plan.tree)
+
+    frame.replay = record_map.get(plan.root, {})
+    frame.records = {}
+    frame.changed = set()
+
+    # Root always runs, it sets the arguments
+    stale = { 0 }
+    sources = get_sources(plan)
+    for entry in plan.nodes:
+        node = entry.node
+        if node in dirty or is_volatile(node):
+            stale.add(entry.index)
+            continue
+
+        for index in sources[entry.index]:
+            source = plan.nodes[index].node
+            if source in dirty or (not hasattr(source, "__execute__") and is_volatile(source)):
+                stale.add(entry.index)
+                break
+
+    frame.stale = stale
+
+
+def replay_node(frame, entry):
+    """Restore node data and fire the outputs of the last run, if nothing it reads changed"""
+
+    if entry.index in frame.stale:
+        return False
+
+    record = frame.replay.get(entry.node)
+    if record is None or not record.replayable or record.count != 1:
+        return False
+
+    for index in get_sources(frame.plan)[entry.index]:
+        if index in frame.changed:
+            return False
+
+    frame.records[entry.node] = record
+    if record.values:
+        frame.values[entry.index] = dict(record.values)
+
+    node = entry.node
+    for name in record.fired:
+        node.execute_next(name)
+    return True
+
+
+def record_node(frame, entry):
+    frame.changed.add(entry.index)
+
+    # Replayed records belong to the last run,
+    # a new execution starts a record of its own
+    record = frame.records.get(entry.node)
+    if record is None or record is frame.replay.get(entry.node):
+        record = frame.records[entry.node] = EG_NodeRecord()
+
+    record.count += 1
+    return record
+
+
+def finish_incremental(frame):
+
+    # A run which failed or was stopped may have left the scene
+    # half way, the next one executes everything again
+    root = frame.plan.root
+    if frame.cancelled or frame.errors:
+        record_map.pop(root, None)
+        return
+
+    for node, record in frame.records.items():
+        if node in frame.plan.entries and record.values is None:
+            values = frame.values[frame.plan.entries[node].index]
+            record.values = dict(values) if values else None
+
+    record_map[root] = frame.records
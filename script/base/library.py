@@ -1,6 +1,10 @@
 import mathutils
 import bpy
 
+from .frame import current_frame
+from .cache import cache_store
+from .disk import disk_cache
+
 
 def get_package_name():
     return __package__.replace(".script.base", "")
@@ -21,27 +25,49 @@ def is_vector(vec, size):
     return isinstance(vec, tuple) and len(vec) == size
 
 
-cache_map = {}
-
-def flush_cache():
-    cache_map.clear()
+def flush_cache(namespace=None):
+    cache_store.clear(namespace)
     print("Cache flushed")
 
-def add_cache(name, value):
-    cache_map[name] = value
+def add_cache(name, value, pinned=False, ttl=0.0, disk=False, version=""):
+    cache_store.set(name, value, pinned=pinned, ttl=ttl)
+    if disk:
+        disk_cache.write(name, value, version)
+
+def get_cache(name, disk=False, version=""):
+    missing = object()
+    value = cache_store.get(name, default=missing)
+    if value is not missing or not disk:
+        return None if value is missing else value
+
+    # Memory was flushed or blender restarted,
+    # load the file once and keep it in memory again
+    found, value = disk_cache.read(name, version)
+    if not found:
+        return None
 
-def get_cache(name):
-    return cache_map.get(name, None)
+    cache_store.set(name, value)
+    return value
 
 def remove_cache(name):
-    if name in cache_map:
-        del cache_map[name]
+    cache_store.remove(name)
+
+def get_linked_key(node, name):
+    return (node.id_data.name, node.name, name)
+
+def keep_linked_cache(node, name, value, depends):
+    # Kept after the run, until the depsgraph
+    # reports a change of what the value was read from
+    cache_store.set(get_linked_key(node, name), value, namespace="linked", depends=depends)
+
+def get_kept_cache(node, name, default=None):
+    return cache_store.get(get_linked_key(node, name), namespace="linked", default=default)
 
 def add_linked_cache(node, name, value):
-    add_cache(f"{node.node_uuid}_{name}", value)
+    current_frame().set_value(node, name, value)
 
 def get_linked_cache(node, name):
-    return get_cache(f"{node.node_uuid}_{name}")
+    return current_frame().get_value(node, name)
 
 def remove_linked_cache(node, name):
-    remove_cache(f"{node.node_uuid}_{name}")
\ No newline at end of file
+    current_frame().remove_value(node, name)
\ No newline at end of file
@@ -1,9 +1,15 @@
-import uuid
 import bpy
-from bpy.props import ( StringProperty )
+import time
 from enum import Enum
+from types import GeneratorType
 
 from ..socket.derived import EGS_Execute, EGS_Callback
+from .compiler import active_plan
+from .frame import EG_CancelToken, EG_ExecutionFrame, active_frame, frame_stack, report_error
+from .tree import get_topology, invalidate_topology, mark_dirty
+from .incremental import replay_node, record_node, finish_incremental
+from .profiler import profiler
+from .tracer import tracer
 
 
 class EG_NodeType(Enum):
@@ -11,6 +17,227 @@ class EG_NodeType(Enum):
     IMPURE = 1
 
 
+# Flows being stepped, innermost last so fired
+# exec outputs go to the flow that is running
+executor_stack = []
+
+
+def resume_node(task):
+
+    # Run generator until its next yield and
+    # report if it wants to be resumed again
+    try:
+        next(task)
+        return True
+
+    except StopIteration:
+        return False
+
+    except Exception as e:
+        print(e)
+        report_error(task.__qualname__, e)
+        return False
+
+
+class EG_Flow:
+    """Explicit work stack of a running exec flow"""
+
+    __slots__ = ("stack", "pending", "token", "result", "started", "steps", "wait_until")
+
+    def __init__(self, task, token=None):
+        self.stack = [task]
+        self.pending = []
+        self.token = token or EG_CancelToken()
+        self.result = None
+        self.started = False
+        self.steps = 0
+
+        # perf counter time the flow sleeps until
+        self.wait_until = 0.0
+
+    @property
+    def finished(self):
+        return not self.stack
+
+    def wait(self, seconds):
+        self.wait_until = time.perf_counter() + seconds
+
+    def cancel(self):
+
+        # Close suspended nodes so their cleanup
+        # runs, then drop everything left to do
+        for task in self.stack:
+            if task.__class__ is GeneratorType:
+                task.close()
+
+        self.stack.clear()
+        self.pending.clear()
+        self.wait_until = 0.0
+
+    def sleep(self):
+
+        # Sleep in short steps so a cancel
+        # from a timer or handler is noticed
+        while not self.token.cancelled:
+            remaining = self.wait_until - time.perf_counter()
+            if remaining <= 0:
+                break
+            time.sleep(min(remaining, 0.1))
+
+        self.wait_until = 0.0
+
+    def run(self, deadline=None):
+        """Run until the flow finished, or the deadline passed or it waits"""
+
+        stack = self.stack
+        pending = self.pending
+        token = self.token
+
+        executor_stack.append(self)
+        try:
+            while stack:
+                if token.cancelled:
+                    self.cancel()
+                    break
+
+                task = stack.pop()
+                self.steps += 1
+
+                # Nodes which need to continue after a triggered
+                # flow finished return a generator and yield
+                if task.__class__ is GeneratorType:
+                    if resume_node(task):
+                        stack.append(task)
+
+                else:
+                    output = task()
+                    if not self.started:
+                        self.result = output
+                        self.started = True
+
+                    if output.__class__ is GeneratorType and resume_node(output):
+                        stack.append(output)
+
+                # Queue fired outputs in reverse so the first one
+                # and everything it triggers runs before the rest
+                if pending:
+                    stack.extend(reversed(pending))
+                    pending.clear()
+
+                # Sleep here when running blocking, else hand
+                # control back until the wait is over
+                if self.wait_until:
+                    if deadline is not None:
+                        break
+                    self.sleep()
+
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+
+        finally:
+            executor_stack.pop()
+
+        return self.finished
+
+
+def active_flow():
+    return executor_stack[-1] if executor_stack else None
+
+
+def execute_flow(task, token=None):
+    """Run a node and everything it triggers without growing the python stack"""
+
+    flow = EG_Flow(task, token)
+    flow.run()
+    return flow.result
+
+
+def schedule_flow(task):
+    if executor_stack:
+        executor_stack[-1].pending.append(task)
+    else:
+        execute_flow(task)
+
+
+def execute_frame(frame, task):
+
+    # Make frame visible to node lookups
+    # while the task is running
+    frame_stack.append(frame)
+    try:
+        execute_flow(task, frame.token)
+        return frame.result
+    finally:
+        frame_stack.pop()
+        finish_frame(frame)
+
+
+def finish_frame(frame):
+    if frame.cancelled:
+        frame.release()
+        print("Execution cancelled")
+    else:
+        frame.commit()
+
+    # Data already changed stays changed when the run
+    # was cancelled, so it gets its undo step anyway
+    if frame.undo:
+        frame.undo = False
+        try:
+            bpy.ops.ed.undo_push()
+        except RuntimeError as e:
+            print(e)
+
+    if frame.replay is not None:
+        finish_incremental(frame)
+
+
+def execute_plan(plan, args=None, frame=None):
+
+    # Arguments are read from the args output
+    # of the root function node
+    frame = frame or EG_ExecutionFrame(plan)
+    if args is not None:
+        frame.set_value(plan.root, "args", args)
+
+    if not plan.trace:
+        return execute_frame(frame, plan.nodes[0].run)
+
+    # Nested runs are recorded inside the span
+    # of the node which started them
+    start = tracer.now()
+    try:
+        return execute_frame(frame, plan.nodes[0].run)
+    finally:
+        tracer.record(f"run {plan.tree.name}/{plan.root.name}", "run", start)
+        if not frame_stack:
+            tracer.save()
+
+
+def step_frame(frame, flow, deadline):
+
+    # Run a slice of the flow inside its frame,
+    # writes are applied once the flow finished
+    frame.objects = None
+    frame_stack.append(frame)
+    try:
+        finished = flow.run(deadline)
+    finally:
+        frame_stack.pop()
+
+    if finished:
+        finish_frame(frame)
+    return finished
+
+
+def update_node(self, context):
+
+    # Values folded or compiled from node properties
+    # are stale, so rebuild plans of the tree
+    invalidate_topology(self.id_data)
+    mark_dirty(self)
+
+
 class EG_PureNode(bpy.types.Node):
     """Pure node doesnt have execute socket"""
 
@@ -21,6 +248,26 @@ class EG_PureNode(bpy.types.Node):
     
     node_type = EG_NodeType.PURE
 
+    # Outputs only depend on inputs and properties, so they can
+    # be reused until a node they depend on executes again
+    memoize = False
+
+    # Outputs also depend on blender data outside of the graph
+    reads_scene = False
+
+    # Memoized outputs may be kept across runs by their input
+    # values, turn off when inputs are large or costly to hash
+    persist = True
+
+    def draw_label(self):
+
+        # Show timings of the last profiled run
+        label = self.label or self.bl_label
+        stats = profiler.stats.get(self)
+        if stats and stats.calls:
+            return f"{label}  {stats.total * 1000:.2f} ms"
+        return label
+
     def add_in(self, socket, name = "in", limit = 1, hide_value=True, default=None, is_array=False):
         pin = self.inputs.new(socket, name)
         pin.link_limit = limit
@@ -43,6 +290,14 @@ class EG_PureNode(bpy.types.Node):
         self.outputs.remove(self.outputs[name])
 
     def get_input_value(self, name):
+
+        # Use pre-resolved binding if node is part
+        # of the running plan
+        plan = active_plan()
+        entry = plan.entries.get(self) if plan else None
+        if entry:
+            pull = entry.pull.get(name)
+            return pull() if pull else None
         
         # Get socket and check if its valid
         # else return None
@@ -51,12 +306,13 @@ class EG_PureNode(bpy.types.Node):
 
             # Check if socket is linked and get its value
             # else get default value
-            if input_socket.is_linked and input_socket.links[0]:
+            peers = get_topology(self.id_data).get_inputs(self, name)
+            if peers:
 
                 # Get source node and its name
                 # and create binding method name
-                source_node = input_socket.links[0].from_node
-                source_method = f"on_{input_socket.links[0].from_socket.name.replace(' ', '_')}"
+                source_node, source_socket = peers[0]
+                source_method = f"on_{source_socket.name.replace(' ', '_')}"
 
                 # If source node have its binding method then
                 # return its value
@@ -77,6 +333,13 @@ class EG_PureNode(bpy.types.Node):
         return None
 
     def get_input_values(self, name):
+
+        # Use pre-resolved bindings if node is part
+        # of the running plan
+        plan = active_plan()
+        entry = plan.entries.get(self) if plan else None
+        if entry:
+            return [pull() for pull in entry.pulls.get(name, ())]
         
         values = []
         
@@ -87,17 +350,16 @@ class EG_PureNode(bpy.types.Node):
             
             # If socket is linked then get its values
             # else return default value in list
-            if input_socket.is_linked:
+            peers = get_topology(self.id_data).get_inputs(self, name)
+            if peers:
                 
                 # Iterate through all socket links and
                 # get source node and its value
-                links = input_socket.links
-                for link in links:
+                for source_node, source_socket in peers:
 
                     # Get source node and its name
                     # and create binding method name
-                    source_node = link.from_node
-                    source_method = f"on_{link.from_socket.name.replace(' ', '_')}"
+                    source_method = f"on_{source_socket.name.replace(' ', '_')}"
 
                     # If source node have its binding method then
                     # return its value
@@ -110,10 +372,7 @@ class EG_PureNode(bpy.types.Node):
 
             else:
                 if hasattr(input_socket, "default_value"):
-                    return values.append(input_socket.default_value)
-                
-                else:
-                    return values
+                    values.append(input_socket.default_value)
 
         return values
     
@@ -126,17 +385,15 @@ class EG_Node(EG_PureNode):
     bl_icon = "SYSTEM"
 
     node_type = EG_NodeType.IMPURE
-    node_uuid: StringProperty(name="UUID", default=str(uuid.uuid4())) # type: ignore
 
-    def raid(self):
-        self.node_uuid = str(uuid.uuid4())
+    # Incremental runs may skip this node when nothing it reads
+    # changed, turn off for nodes keeping state between runs
+    replay = True
 
     def init(self, context):
-        self.raid()
+        pass
 
     def draw_buttons(self, context, layout):
-        # enable for debug
-        # layout.prop(self, "node_uuid")
         pass
 
     def add_exec_in(self, name = "in", is_callback = False):
@@ -153,52 +410,132 @@ class EG_Node(EG_PureNode):
 
     def execute_next(self, name):
 
-        # Get output socket and check if its valid
-        # and linked
-        output_socket = self.outputs.get(name)
-        if output_socket and output_socket.is_linked:
-
-            # Get first linked node and check if it
-            # have execute method and call it
-            target_node = output_socket.links[0].to_node
+        # Use pre-resolved target if node is part
+        # of the running plan
+        frame = active_frame()
+        entry = frame.plan.entries.get(self) if frame and frame.plan else None
+        if entry:
+            # Outputs of this node may have changed, so
+            # memoized values depending on it are stale
+            frame.epochs[entry.index] += 1
+
+            record = frame.records.get(self) if frame.replay is not None else None
+            if record and record is not frame.replay.get(self):
+                record.fired.append(name)
+
+            target = entry.next.get(name)
+            if target:
+                schedule_flow(target.run)
+            return
+
+        # Get first linked node of the output socket and
+        # check if it have execute method and call it
+        peers = get_topology(self.id_data).get_outputs(self, name)
+        if peers:
+
+            target_node = peers[0][0]
             if hasattr(target_node, "__execute__"):
 
-                target_node.__execute__()
+                schedule_flow(target_node.__execute__)
     
     def execute_previous(self, name):
 
-        # Get input socket and check if its valid
-        # and linked
-        input_socket = self.inputs.get(name)
-        if input_socket and input_socket.is_linked:
-
-            # Get first linked node and check if it
-            # have execute method and call it
-            source_node = input_socket.links[0].from_node
+        # Use pre-resolved source if node is part
+        # of the running plan
+        plan = active_plan()
+        entry = plan.entries.get(self) if plan else None
+        if entry:
+            source = entry.previous.get(name)
+            if source:
+                schedule_flow(source.run)
+            return
+
+        # Get first linked node of the input socket and
+        # check if it have execute method and call it
+        peers = get_topology(self.id_data).get_inputs(self, name)
+        if peers:
+
+            source_node = peers[0][0]
             if hasattr(source_node, "__execute__"):
 
-                source_node.__execute__()
+                schedule_flow(source_node.__execute__)
 
     def __execute__(self):
 
         try:
 
+            # Incremental runs skip nodes whose inputs did not
+            # change and fire the outputs of their last run
+            frame = active_frame()
+            if frame and frame.replay is not None:
+                entry = frame.plan.entries.get(self)
+                if entry:
+                    if replay_node(frame, entry):
+                        return
+
+                    record = record_node(frame, entry)
+                    if self.before_execute():
+                        output = self.execute()
+                        if output.__class__ is GeneratorType:
+                            record.replayable = False
+                        return output
+
+                    print("Node execution failed or terminated")
+                    return
+
             if self.before_execute():
-                self.execute()
+                return self.execute()
             else:
                 print("Node execution failed or terminated")
 
         except Exception as e:
             print(e)
+            report_error(self.name, e)
 
     def before_execute(self):
 
-        # Generate unique node uuid when its about to be executed
-        # to prevent sharing of data between similar nodes
-        self.raid()
+        frame = active_frame()
+        entry = frame.plan.entries.get(self) if frame and frame.plan else None
+        if entry:
+            frame.touch(entry)
 
         return True
 
+    def resume_later(self, name):
+
+        # Continue an exec output later from outside the
+        # executor, but still inside the frame of this run
+        frame = active_frame() or EG_ExecutionFrame()
+        frame.pending += 1
+
+        def task():
+            frame.pending -= 1
+            self.execute_next(name)
+
+        # Editor ran in between, objects may be
+        # renamed or deleted since the index was built
+        def resume():
+            frame.objects = None
+            return execute_frame(frame, task)
+
+        # Continuations can't be replayed without the wait
+        record = frame.records.get(self) if frame.replay is not None else None
+        if record:
+            record.replayable = False
+
+        if not (frame.plan and frame.plan.trace):
+            return resume
+
+        def traced():
+            start = tracer.now()
+            try:
+                resume()
+            finally:
+                tracer.record(f"{self.name} continuation", "timer", start)
+                tracer.save()
+
+        return traced
+
     def execute(self):
         return ""
     
\ No newline at end of file
@@ -0,0 +1,357 @@
+import bpy
+
+from .frame import frame_stack
+from .cache import cache_store
+
+
+# Dependency of values built from the list of objects,
+# stale once objects are added, removed or renamed
+OBJECT_LIST = "OBJECT_LIST"
+
+# (count, hash of names) of objects when lists were kept
+object_fingerprint = None
+
+def get_fingerprint():
+    names = tuple(obj.name for obj in bpy.data.objects)
+    return (len(names), hash(names))
+
+def watch_objects():
+    global object_fingerprint
+    object_fingerprint = get_fingerprint()
+
+def objects_changed(depsgraph):
+    """Whether the update added, removed or renamed objects since lists were kept"""
+
+    global object_fingerprint
+
+    # Moving objects, the most common update,
+    # never changes which objects there are
+    updates = [update for update in depsgraph.updates if isinstance(update.id, bpy.types.Object)]
+    if updates and not depsgraph.id_type_updated("COLLECTION"):
+        if all(update.is_updated_transform and not update.is_updated_geometry for update in updates):
+            return False
+
+    fingerprint = get_fingerprint()
+    if fingerprint == object_fingerprint:
+        return False
+
+    object_fingerprint = fingerprint
+    return True
+
+
+# Bumped on file load and undo, python references
+# to objects made before are not safe to use anymore
+generation = 0
+
+def flush_handles():
+    global generation
+    generation += 1
+
+
+class EG_ObjectHandle:
+    """Reference to an object which stays valid across renames"""
+
+    __slots__ = ("object", "uid", "last_name", "generation")
+
+    def __init__(self, obj):
+        self.object = obj
+        self.uid = getattr(obj, "session_uid", None) or obj.as_pointer()
+        self.last_name = obj.name
+        self.generation = generation
+
+    def get(self):
+        """Return the object, or None if it was removed"""
+
+        # Removed objects raise on access, so
+        # checking costs a single attribute read
+        if self.generation == generation:
+            try:
+                self.last_name = self.object.name
+            except ReferenceError:
+                return None
+            return self.object
+
+        # Find it again after undo or load, by name
+        # first and by session id if it was renamed
+        obj = bpy.data.objects.get(self.last_name)
+        if obj is None or getattr(obj, "session_uid", None) != self.uid:
+            obj = next((item for item in bpy.data.objects if getattr(item, "session_uid", None) == self.uid), None)
+
+        if obj is None:
+            return None
+
+        self.object = obj
+        self.last_name = obj.name
+        self.generation = generation
+        return obj
+
+    @property
+    def valid(self):
+        return self.get() is not None
+
+    @property
+    def name(self):
+        obj = self.get()
+        return obj.name if obj else self.last_name
+
+    def __eq__(self, other):
+        return isinstance(other, EG_ObjectHandle) and other.uid == self.uid
+
+    def __hash__(self):
+        return hash(self.uid)
+
+    def __str__(self):
+        return self.name
+
+    def __repr__(self):
+        return f"<Object {self.name!r}>"
+
+
+def to_handle(value):
+    """Handle of an object, its name or a handle, None if there is no such object"""
+
+    if isinstance(value, EG_ObjectHandle):
+        return value if value.valid else None
+
+    obj = get_object(value) if isinstance(value, str) else value
+    if obj is None or not hasattr(obj, "as_pointer"):
+        return None
+    return EG_ObjectHandle(obj)
+
+
+class EG_ObjectIndex:
+    """Objects of the file by name, built once per run"""
+
+    __slots__ = ("objects", "types", "parents", "layout")
+
+    def __init__(self):
+        self.objects = None
+
+        # name -> type and name -> parent name, filled
+        # on first use as most runs read only a few
+        self.types = {}
+        self.parents = {}
+
+        # Positions in bpy.data.objects for bulk reads
+        # and writes of the whole collection
+        self.layout = None
+
+    def build(self):
+        self.objects = { obj.name: obj for obj in bpy.data.objects }
+        return self.objects
+
+    def get(self, name):
+        objects = self.objects
+        if objects is None:
+            objects = self.build()
+        return objects.get(name)
+
+    def get_names(self):
+        objects = self.objects
+        if objects is None:
+            objects = self.build()
+        return list(objects)
+
+    def get_layout(self):
+        if self.layout is None:
+            self.layout = get_layout()
+        return self.layout
+
+    def get_type(self, name):
+        kind = self.types.get(name)
+        if kind is None:
+            obj = self.get(name)
+            if obj is None:
+                return None
+            kind = self.types[name] = obj.type
+        return kind
+
+    def get_parent(self, name):
+        if name in self.parents:
+            return self.parents[name]
+
+        obj = self.get(name)
+        if obj is None:
+            return None
+
+        parent = self.parents[name] = obj.parent.name if obj.parent else ""
+        return parent
+
+    def add(self, obj):
+        if self.objects is not None:
+            self.objects[obj.name] = obj
+        self.layout = None
+
+    def rename(self, name, obj):
+
+        # Blender may give the object another name than
+        # asked for, so read it back from the object
+        if self.objects is not None:
+            self.objects.pop(name, None)
+            self.objects[obj.name] = obj
+
+        kind = self.types.pop(name, None)
+        if kind is not None:
+            self.types[obj.name] = kind
+        self.parents.clear()
+        self.layout = None
+
+    def remove(self, name):
+        if self.objects is not None:
+            self.objects.pop(name, None)
+        self.types.pop(name, None)
+        self.parents.clear()
+        self.layout = None
+
+    def remove_uids(self, uids):
+
+        # Removed objects raise on access, names can't
+        # be read from them anymore
+        if self.objects is not None:
+            for name, obj in list(self.objects.items()):
+                try:
+                    removed = obj.session_uid in uids
+                except ReferenceError:
+                    removed = True
+                if removed:
+                    del self.objects[name]
+                    self.types.pop(name, None)
+        self.parents.clear()
+        self.layout = None
+
+    def set_parent(self, name, parent):
+        self.parents[name] = parent
+
+    def clear(self):
+        self.objects = None
+        self.types.clear()
+        self.parents.clear()
+        self.layout = None
+
+
+def get_layout():
+    """(session uid -> position in bpy.data.objects, whether any object is linked)"""
+
+    # Names repeat across libraries, the
+    # session uid is unique within the file
+    positions = {}
+    linked = False
+    for position, obj in enumerate(bpy.data.objects):
+        positions[obj.session_uid] = position
+        linked = linked or getattr(obj, "library", None) is not None
+    return positions, linked
+
+
+def get_object_index():
+
+    # Index lives as long as the outermost run so nested runs
+    # see the same objects, nodes evaluated outside of a run
+    # get None and read bpy.data
+    if not frame_stack:
+        return None
+
+    frame = frame_stack[0]
+
+    index = frame.objects
+    if index is None:
+        index = frame.objects = EG_ObjectIndex()
+    return index
+
+
+def to_name(value):
+
+    # Ids come from sockets as any value
+    return value if isinstance(value, str) else str(value)
+
+def get_object(name):
+
+    # Handles skip the name lookup
+    if isinstance(name, EG_ObjectHandle):
+        return name.get()
+
+    name = to_name(name)
+    index = get_object_index()
+    if index is None:
+        return bpy.data.objects.get(name)
+    return index.get(name)
+
+def get_object_type(name):
+    if isinstance(name, EG_ObjectHandle):
+        obj = name.get()
+        return obj.type if obj else None
+
+    name = to_name(name)
+    index = get_object_index()
+    if index is None:
+        obj = bpy.data.objects.get(name)
+        return obj.type if obj else None
+    return index.get_type(name)
+
+def get_object_parent(name):
+    if isinstance(name, EG_ObjectHandle):
+        obj = name.get()
+        return (obj.parent.name if obj.parent else "") if obj else None
+
+    name = to_name(name)
+    index = get_object_index()
+    if index is None:
+        obj = bpy.data.objects.get(name)
+        return (obj.parent.name if obj.parent else "") if obj else None
+    return index.get_parent(name)
+
+def get_object_names():
+    index = get_object_index()
+    if index is None:
+        return [obj.name for obj in bpy.data.objects]
+    return index.get_names()
+
+
+# Nodes which add, rename or remove objects keep the index
+# in sync and drop object lists kept by the cache
+
+def add_object(obj):
+    index = get_object_index()
+    if index:
+        index.add(obj)
+    cache_store.invalidate((OBJECT_LIST,))
+
+def rename_object(name, obj):
+    index = get_object_index()
+    if index:
+        index.rename(name, obj)
+    cache_store.invalidate((OBJECT_LIST,))
+
+def remove_object(name):
+    index = get_object_index()
+    if index:
+        index.remove(name)
+    cache_store.invalidate((OBJECT_LIST,))
+
+def remove_objects(uids):
+    index = get_object_index()
+    if index:
+        index.remove_uids(uids)
+    cache_store.invalidate((OBJECT_LIST,))
+
+def reparent_object(name, parent):
+    index = get_object_index()
+    if index:
+        index.set_parent(name, parent)
+
+def reset_objects():
+    index = get_object_index()
+    if index:
+        index.clear()
+    cache_store.invalidate((OBJECT_LIST,))
+
+
+def push_undo():
+    """Push an undo step once the graph run ends, or now outside of runs"""
+
+    if not frame_stack:
+        bpy.ops.ed.undo_push()
+        return
+
+    # Flagged on the outer frame, so a run makes
+    # one step which covers every change it made
+    frame_stack[0].undo = True
@@ -0,0 +1,104 @@
+import time
+from types import GeneratorType
+
+
+class EG_NodeStats:
+    """Call count and timings of a single node"""
+
+    __slots__ = ("calls", "total", "own")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.own = 0.0
+
+
+class EG_Profiler:
+    """Collects timings of instrumented node calls"""
+
+    def __init__(self):
+        self.stats = {}
+
+        # time spent in nested instrumented calls,
+        # one entry per call that is running
+        self.children = [0.0]
+
+    def reset(self):
+
+        # Zero in place, instrumented plans
+        # keep references to these stats
+        for stats in self.stats.values():
+            stats.calls = 0
+            stats.total = 0.0
+            stats.own = 0.0
+        self.children[:] = [0.0]
+
+    def clear(self):
+        self.stats.clear()
+        self.children[:] = [0.0]
+
+    def get_stats(self, node):
+        stats = self.stats.get(node)
+        if stats is None:
+            stats = self.stats[node] = EG_NodeStats()
+        return stats
+
+    def wrap(self, node, method, count=1):
+
+        stats = self.get_stats(node)
+        children = self.children
+        clock = time.perf_counter
+
+        def timed():
+            children.append(0.0)
+            start = clock()
+            try:
+                return method()
+            finally:
+                elapsed = clock() - start
+                child = children.pop()
+                children[-1] += elapsed
+
+                stats.calls += count
+                stats.total += elapsed
+                stats.own += elapsed - child
+
+        return timed
+
+    def wrap_pull(self, node, socket_name, method):
+        return self.wrap(node, method)
+
+    def wrap_run(self, node, method):
+
+        timed = self.wrap(node, method)
+
+        def timed_generator(generator):
+
+            # Resumes of a suspended node add to
+            # its time but not to its calls
+            resume = self.wrap(node, generator.__next__, 0)
+            try:
+                while True:
+                    try:
+                        resume()
+                    except StopIteration:
+                        return
+                    yield
+            finally:
+                generator.close()
+
+        def run():
+            output = timed()
+            if output.__class__ is GeneratorType:
+                return timed_generator(output)
+            return output
+
+        return run
+
+    def rows(self):
+        rows = [(node, stats) for node, stats in self.stats.items() if stats.calls]
+        rows.sort(key=lambda row: row[1].total, reverse=True)
+        return rows
+
+
+profiler = EG_Profiler()
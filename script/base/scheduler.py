@@ -0,0 +1,97 @@
+import time
+import bpy
+
+from .frame import EG_ExecutionFrame, running_frames
+from .node import EG_Flow, step_frame
+from .tracer import tracer
+
+
+# Timed runs which are still in progress
+timed_runs = []
+
+
+def set_status(window, text):
+
+    # Timers run without a window in the context,
+    # so use the one the run was started from
+    if window is None:
+        return
+
+    try:
+        with bpy.context.temp_override(window=window):
+            window.workspace.status_text_set(text)
+    except (ReferenceError, TypeError, AttributeError):
+        pass
+
+
+class EG_TimedRun:
+    """Compiled plan executed in slices from a timer"""
+
+    def __init__(self, plan, budget, frame=None):
+        self.plan = plan
+        self.frame = frame or EG_ExecutionFrame(plan)
+        self.flow = EG_Flow(plan.nodes[0].run, self.frame.token)
+
+        # Budget of a single tick in seconds
+        self.budget = budget / 1000
+        self.started = time.perf_counter()
+
+        # Window the progress is shown in
+        self.window = getattr(bpy.context, "window", None)
+
+    @property
+    def finished(self):
+        return self not in timed_runs
+
+    def start(self):
+        timed_runs.append(self)
+        running_frames.append(self.frame)
+        bpy.app.timers.register(self.tick)
+
+    def cancel(self):
+        self.frame.cancel()
+
+    def finish(self):
+        if self in timed_runs:
+            timed_runs.remove(self)
+        if self.frame in running_frames:
+            running_frames.remove(self.frame)
+
+        set_status(self.window, None)
+        if not self.frame.cancelled:
+            print(f"Output Node Result: {self.frame.result}")
+
+        if self.plan.trace:
+            tracer.save()
+
+    def tick(self):
+        flow = self.flow
+
+        # Sleep of a delay node is spent between
+        # ticks so the editor keeps running
+        if flow.wait_until and not self.frame.cancelled:
+            remaining = flow.wait_until - time.perf_counter()
+            if remaining > 0:
+                return remaining
+            flow.wait_until = 0.0
+
+        start = tracer.now()
+        try:
+            finished = step_frame(self.frame, flow, time.perf_counter() + self.budget)
+        except Exception as e:
+            print(e)
+            finished = True
+
+        if self.plan.trace:
+            tracer.record("tick", "timer", start)
+
+        if finished:
+            self.finish()
+            return None
+
+        elapsed = time.perf_counter() - self.started
+        set_status(self.window, f"Event Graph: {self.plan.root.name} running, {flow.steps} steps in {elapsed:.1f}s")
+
+        if flow.wait_until:
+            return max(flow.wait_until - time.perf_counter(), 0.0)
+        return 0.0
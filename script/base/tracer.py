@@ -0,0 +1,97 @@
+import os
+import json
+import time
+from types import GeneratorType
+
+
+class EG_Tracer:
+    """Records node calls as chrome trace events"""
+
+    def __init__(self):
+        self.events = []
+        self.path = ""
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+
+    def start(self, path):
+        self.events.clear()
+        self.path = path
+        self.origin = time.perf_counter()
+
+    def now(self):
+        return (time.perf_counter() - self.origin) * 1000000
+
+    def record(self, name, category, start, args=None):
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start,
+            "dur": self.now() - start,
+            "pid": self.pid,
+            "tid": 1,
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def span(self, name, category, method):
+        """Wrap method so every call of it is recorded"""
+
+        def traced():
+            start = self.now()
+            try:
+                return method()
+            finally:
+                self.record(name, category, start)
+
+        return traced
+
+    def wrap_pull(self, node, socket_name, method):
+        return self.span(f"{node.name}.{socket_name}", "pull", method)
+
+    def wrap_run(self, node, method):
+
+        traced = self.span(node.name, "node", method)
+
+        def traced_generator(generator):
+
+            # Each resume starts the next iteration, which
+            # lasts until the node is resumed again
+            iteration = 0
+            start = None
+            try:
+                while True:
+                    if start is not None:
+                        self.record(f"{node.name} #{iteration}", "iteration", start)
+                        iteration += 1
+
+                    start = self.now()
+                    try:
+                        generator.__next__()
+                    except StopIteration:
+                        return
+                    yield
+            finally:
+                generator.close()
+
+        def run():
+            output = traced()
+            if output.__class__ is GeneratorType:
+                return traced_generator(output)
+            return output
+
+        return run
+
+    def save(self):
+        if not self.path or not self.events:
+            return
+
+        try:
+            with open(self.path, "w") as file:
+                json.dump({ "traceEvents": self.events, "displayTimeUnit": "ms" }, file)
+        except OSError as e:
+            print(f"Trace could not be written: {e}")
+
+
+tracer = EG_Tracer()
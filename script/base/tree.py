@@ -1,7 +1,139 @@
 import bpy
 
+from .frame import cancel_frames
+
+
+class EG_Topology:
+    """Plain python snapshot of the links in a tree"""
+
+    def __init__(self, tree):
+
+        # node -> {socket name -> [(peer node, peer socket)]}
+        self.inputs = {}
+        self.outputs = {}
+
+        # Compiled plans of this tree by root node and options
+        self.plans = {}
+
+        for link in tree.links:
+            self.outputs.setdefault(link.from_node, {}).setdefault(link.from_socket.name, []).append((link.to_node, link.to_socket))
+            self.inputs.setdefault(link.to_node, {}).setdefault(link.to_socket.name, []).append((link.from_node, link.from_socket))
+
+    def get_inputs(self, node, name):
+        return self.inputs.get(node, {}).get(name, ())
+
+    def get_outputs(self, node, name):
+        return self.outputs.get(node, {}).get(name, ())
+
+
+topology_map = {}
+
+def get_topology(tree):
+    topology = topology_map.get(tree)
+    if topology is None:
+        topology = EG_Topology(tree)
+        topology_map[tree] = topology
+    return topology
+
+def invalidate_topology(tree):
+    topology_map.pop(tree, None)
+
+def flush_topology():
+    topology_map.clear()
+
+
+property_names = {}
+
+def get_property_names(node):
+    kind = type(node)
+    names = property_names.get(kind)
+    if names is None:
+        names = set()
+        for base in kind.__mro__:
+            names.update(getattr(base, "__annotations__", {}))
+        names = property_names[kind] = tuple(sorted(names))
+    return names
+
+
+# tree -> nodes edited since the last incremental run
+dirty_map = {}
+
+# tree -> {(node, socket identifier or property) -> links or value}
+# of trees which are run incrementally
+snapshot_map = {}
+
+def freeze_snapshot(value):
+    if isinstance(value, str):
+        return value
+    try:
+        return tuple(value)
+    except TypeError:
+        return value
+
+def get_snapshot(tree):
+    snapshot = {}
+    for link in tree.links:
+        key = (link.to_node, link.to_socket.identifier)
+        snapshot.setdefault(key, []).append((link.from_node, link.from_socket.identifier))
+
+    for node in tree.nodes:
+        for socket in node.inputs:
+            key = (node, socket.identifier)
+            if key not in snapshot and hasattr(socket, "default_value"):
+                snapshot[key] = freeze_snapshot(socket.default_value)
+
+        # Properties change what a node does, editing one
+        # doesn't always call the update of the tree
+        for name in get_property_names(node):
+            snapshot[(node, name)] = freeze_snapshot(getattr(node, name, None))
+
+    return snapshot
+
+def mark_dirty(node):
+    tree = node.id_data
+    if tree in snapshot_map:
+        dirty_map.setdefault(tree, set()).add(node)
+
+def track_changes(tree):
+    old = snapshot_map.get(tree)
+    if old is None:
+        return
+
+    # Nodes whose input links or values differ
+    # from the last snapshot were edited
+    new = snapshot_map[tree] = get_snapshot(tree)
+    dirty = dirty_map.setdefault(tree, set())
+    for key in old.keys() | new.keys():
+        if old.get(key) != new.get(key):
+            dirty.add(key[0])
+
+def watch_tree(tree):
+    if tree not in snapshot_map:
+        snapshot_map[tree] = get_snapshot(tree)
+
+def take_dirty(tree):
+    return dirty_map.pop(tree, set())
+
+def flush_changes():
+    dirty_map.clear()
+    snapshot_map.clear()
+
+
 class EG_NodeTree(bpy.types.NodeTree):
     """Event Event Graph"""
     bl_idname = "eg_nodetree"
     bl_label = "Event Graph"
-    bl_icon = "EXPERIMENTAL"
\ No newline at end of file
+    bl_icon = "EXPERIMENTAL"
+
+    def update(self):
+        # Drop link snapshot and compiled plans,
+        # they are rebuilt when needed again
+        invalidate_topology(self)
+
+        # Remember which nodes changed, so an
+        # incremental run only executes those
+        track_changes(self)
+
+        # Runs still hold nodes and links of the
+        # old tree, which may not exist anymore
+        cancel_frames(tree=self)
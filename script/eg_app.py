@@ -4,6 +4,8 @@ from .eg_operator import register as register_operator, unregister as unregister
 from .eg_category import register as register_category, unregister as unregister_category
 from .eg_preference import register as register_preference, unregister as unregister_preference
 from .eg_socket import register as register_socket, unregister as unregister_socket
+from .eg_handler import register as register_handler, unregister as unregister_handler
+from .eg_panel import register as register_panel, unregister as unregister_panel
 
 def register():
     register_tree()
@@ -11,7 +13,9 @@ def register():
     register_node()
     register_operator()
     register_category()
+    register_panel()
     register_preference()
+    register_handler()
 
 def unregister():
     unregister_tree()
@@ -19,4 +23,6 @@ def unregister():
     unregister_node()
     unregister_operator()
     unregister_category()
-    unregister_preference()
\ No newline at end of file
+    unregister_panel()
+    unregister_preference()
+    unregister_handler()
\ No newline at end of file
@@ -0,0 +1,66 @@
+import bpy
+from bpy.app.handlers import persistent
+
+from .base.tree import flush_topology, flush_changes
+from .base.incremental import flush_records
+from .base.frame import flush_idle_frame, cancel_frames
+from .base.objects import flush_handles, objects_changed, OBJECT_LIST
+from .base.profiler import profiler
+from .base.cache import cache_store
+
+
+@persistent
+def on_data_reload(*args):
+    # Node pointers are not valid anymore after
+    # file load or undo, so drop everything built from them
+    cancel_frames()
+    flush_topology()
+    flush_idle_frame()
+    flush_handles()
+    profiler.clear()
+    cache_store.clear("linked")
+
+    # Scene may not hold what the last
+    # runs left, so replay nothing
+    flush_changes()
+    flush_records()
+
+
+@persistent
+def on_depsgraph_update(scene, depsgraph):
+    if not cache_store.dependents:
+        return
+
+    # Whole ID types are cheap to check, single
+    # datablocks need a look at every update
+    changed = [depend for depend in cache_store.dependents if isinstance(depend, str) and depend != OBJECT_LIST and depsgraph.id_type_updated(depend)]
+
+    if OBJECT_LIST in cache_store.dependents and objects_changed(depsgraph):
+        changed.append(OBJECT_LIST)
+
+    if any(not isinstance(depend, str) for depend in cache_store.dependents):
+        for update in depsgraph.updates:
+            data = update.id.original
+            changed.append((data.id_type, data.name))
+
+    if changed:
+        cache_store.invalidate(changed)
+
+
+handlers = [
+    bpy.app.handlers.load_post,
+    bpy.app.handlers.undo_post,
+    bpy.app.handlers.redo_post,
+]
+
+def register():
+    for handler in handlers:
+        handler.append(on_data_reload)
+    bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update)
+
+def unregister():
+    for handler in handlers:
+        if on_data_reload in handler:
+            handler.remove(on_data_reload)
+    if on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(on_depsgraph_update)
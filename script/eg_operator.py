@@ -1,9 +1,13 @@
 import bpy
 
-from .operator import exec_main
+from .operator import exec_main, exec_stop, exec_headless, profiler, cache
 
 classes = []
 classes += exec_main.classes
+classes += exec_stop.classes
+classes += exec_headless.classes
+classes += profiler.classes
+classes += cache.classes
 
 def register():
     for cls in classes:
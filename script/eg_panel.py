@@ -0,0 +1,15 @@
+import bpy
+
+from .panel import profiler, cache
+
+classes = []
+classes += profiler.classes
+classes += cache.classes
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
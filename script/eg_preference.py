@@ -1,14 +1,129 @@
 import bpy
 from bpy.types import AddonPreferences
-from bpy.props import ( StringProperty, BoolProperty )
+from bpy.props import ( StringProperty, BoolProperty, EnumProperty, IntProperty, FloatProperty )
 
 from .base.library import get_package_name
+from .base.tree import flush_topology
+from .base.cache import cache_store
+
+
+def update_plans(self, context):
+    flush_topology()
+
+def update_cache(self, context):
+    cache_store.configure(self.cache_max_entries, int(self.cache_max_megabytes * 1024 * 1024))
+
 
 class EG_Preference(AddonPreferences):
     bl_idname = get_package_name()
 
+    memoize_pure: BoolProperty(
+        name="Memoize Pure Nodes",
+        description="Evaluate pure nodes once per run until a node they depend on executes again",
+        default=False,
+        update=update_plans
+    ) # type: ignore
+
+    persist_pure: BoolProperty(
+        name="Reuse Across Runs",
+        description="Keep results of memoized pure nodes by their inputs and properties, so later runs only compute what changed",
+        default=False,
+        update=update_plans
+    ) # type: ignore
+
+    profile_nodes: BoolProperty(
+        name="Profile Nodes",
+        description="Record call counts and timings of every node, shown in the node label and the sidebar",
+        default=False,
+        update=update_plans
+    ) # type: ignore
+
+    trace_runs: BoolProperty(
+        name="Trace Runs",
+        description="Record a timeline of every node call and write it as chrome trace JSON",
+        default=False,
+        update=update_plans
+    ) # type: ignore
+
+    trace_path: StringProperty(
+        name="Trace File",
+        description="File the timeline is written to, opens in Perfetto or chrome://tracing",
+        default="//event_graph_trace.json",
+        subtype="FILE_PATH"
+    ) # type: ignore
+
+    execution_mode: EnumProperty(
+        name="Execution Mode",
+        description="How the Execute button runs a graph",
+        items=[
+            ("BLOCKING", "Blocking", "Run the whole graph at once"),
+            ("TIMED", "Timed", "Run the graph in short slices so the interface stays responsive"),
+        ],
+        default="BLOCKING"
+    ) # type: ignore
+
+    incremental_runs: BoolProperty(
+        name="Incremental Runs",
+        description="Execute only nodes affected by edits since the last run, others fire the outputs they fired before",
+        default=False
+    ) # type: ignore
+
+    time_budget: IntProperty(
+        name="Time Budget",
+        description="Milliseconds a timed run may execute per tick",
+        default=8,
+        min=1,
+        max=1000,
+        subtype="TIME"
+    ) # type: ignore
+
+    cache_max_entries: IntProperty(
+        name="Cache Entries",
+        description="Entries the runtime cache holds before the least recently used are evicted",
+        default=10000,
+        min=1,
+        update=update_cache
+    ) # type: ignore
+
+    cache_max_megabytes: FloatProperty(
+        name="Cache Size (MB)",
+        description="Approximate memory the runtime cache may use before entries are evicted",
+        default=256.0,
+        min=1.0,
+        update=update_cache
+    ) # type: ignore
+
+    debug_mode: BoolProperty(
+        name="Debug Mode",
+        description="Write runtime node state such as loop indices back to node properties after each run",
+        default=False
+    ) # type: ignore
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "memoize_pure")
+        if self.memoize_pure:
+            layout.prop(self, "persist_pure")
+        layout.prop(self, "profile_nodes")
+        layout.prop(self, "trace_runs")
+        if self.trace_runs:
+            layout.prop(self, "trace_path")
+        layout.prop(self, "execution_mode")
+        if self.execution_mode == "TIMED":
+            layout.prop(self, "time_budget")
+        layout.prop(self, "incremental_runs")
+        layout.prop(self, "cache_max_entries")
+        layout.prop(self, "cache_max_megabytes")
+        layout.prop(self, "debug_mode")
+
 def register():
     bpy.utils.register_class(EG_Preference)
 
+    # Apply stored limits, update callbacks
+    # only run when they are edited
+    preferences = bpy.context.preferences.addons.get(EG_Preference.bl_idname)
+    if preferences:
+        update_cache(preferences.preferences, bpy.context)
+
 def unregister():
     bpy.utils.unregister_class(EG_Preference)
\ No newline at end of file
@@ -0,0 +1,170 @@
+# Runs an event graph over many .blend files with a pool of background
+# blender processes, standalone so it works without blender:
+#
+#   python farm.py --blender blender --tree Cleanup --jobs 8 --report report.json assets/*.blend
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Runs inside every blender process, opens each file of its
+# partition and runs the graph through the headless operator
+RUNNER = """
+import bpy, json, os, sys, time, tempfile
+
+files, options = [json.loads(value) for value in sys.argv[sys.argv.index("--") + 1:]]
+output = os.path.join(tempfile.gettempdir(), f"eg_farm_{os.getpid()}.json")
+
+for path in files:
+    start = time.perf_counter()
+    report = { "file": path, "status": "failed" }
+    try:
+        bpy.ops.wm.open_mainfile(filepath=path)
+        if os.path.exists(output):
+            os.remove(output)
+        bpy.ops.egop.execute_headless(tree=options["tree"], node=options["node"], args=options["args"], output=output)
+        with open(output) as file:
+            report.update(json.load(file))
+    except Exception as e:
+        report["error"] = str(e)
+
+    report["file"] = path
+    report["seconds"] = time.perf_counter() - start
+    print("EG_FILE " + json.dumps(report, default=str), flush=True)
+"""
+
+
+def create_command(options, files):
+    graph = json.dumps({ "tree": options.tree, "node": options.node, "args": options.args })
+    return [
+        options.blender, "--background", "--noaudio",
+        "--python-expr", RUNNER, "--", json.dumps(files), graph,
+    ]
+
+
+def run_partition(options, files):
+    """Run one blender process and return reports of the files it finished"""
+
+    reports = []
+    try:
+        process = subprocess.run(
+            create_command(options, files),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            timeout=options.timeout or None,
+        )
+        output = process.stdout
+
+    except subprocess.TimeoutExpired as e:
+        output = e.stdout or ""
+        if isinstance(output, bytes):
+            output = output.decode(errors="replace")
+
+    except OSError as e:
+        # Blender couldn't be started at all, retrying
+        # the files wouldn't go any better
+        return [{ "file": path, "status": "failed", "error": f"Could not start {options.blender}: {e}" } for path in files]
+
+    for line in output.splitlines():
+        if line.startswith("EG_FILE "):
+            try:
+                reports.append(json.loads(line[len("EG_FILE "):]))
+            except ValueError:
+                pass
+
+    return reports
+
+
+class EG_Farm:
+    """Bounded pool of blender workers with retries of crashed partitions"""
+
+    def __init__(self, options):
+        self.options = options
+        self.reports = {}
+        self.attempts = {}
+        self.lock = threading.Lock()
+
+    def process(self, files):
+        pending = list(files)
+
+        while pending:
+            reports = run_partition(self.options, pending)
+
+            with self.lock:
+                for report in reports:
+                    report["attempts"] = self.attempts.get(report["file"], 0) + 1
+                    self.reports[report["file"]] = report
+
+            # Process ended early, the file after the last reported
+            # one crashed it, retry it until it runs out of attempts
+            done = { report["file"] for report in reports }
+            pending = [path for path in pending if path not in done]
+            if not pending:
+                break
+
+            crashed = pending[0]
+            with self.lock:
+                attempts = self.attempts.get(crashed, 0) + 1
+                self.attempts[crashed] = attempts
+
+                if attempts > self.options.retries:
+                    self.reports[crashed] = { "file": crashed, "status": "crashed", "attempts": attempts }
+                    pending = pending[1:]
+
+            print(f"Worker crashed on {crashed}, attempt {attempts}", file=sys.stderr)
+
+    def run(self, files):
+        size = max(self.options.batch, 1)
+        partitions = [files[index:index + size] for index in range(0, len(files), size)]
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.options.jobs) as pool:
+            list(pool.map(self.process, partitions))
+
+        reports = [self.reports[path] for path in files if path in self.reports]
+        summary = { "files": len(files), "seconds": time.perf_counter() - start, "jobs": self.options.jobs }
+        for report in reports:
+            summary[report["status"]] = summary.get(report["status"], 0) + 1
+
+        return { "summary": summary, "files": reports }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run an event graph over many .blend files")
+    parser.add_argument("files", nargs="+", help=".blend files to process")
+    parser.add_argument("--blender", default="blender", help="Blender executable")
+    parser.add_argument("--tree", required=True, help="Name of the event graph")
+    parser.add_argument("--node", default="Function", help="Name of the function node")
+    parser.add_argument("--args", default="null", help="JSON value passed to the function")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Blender processes running at once")
+    parser.add_argument("--batch", type=int, default=8, help="Files opened by one blender process")
+    parser.add_argument("--retries", type=int, default=1, help="Retries of a file which crashed its worker")
+    parser.add_argument("--timeout", type=float, default=0, help="Seconds a worker may run, 0 for no limit")
+    parser.add_argument("--report", default="", help="File the JSON report is written to")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    files = [os.path.abspath(path) for path in options.files]
+
+    report = EG_Farm(options).run(files)
+
+    text = json.dumps(report, indent=2, default=str)
+    if options.report:
+        with open(options.report, "w") as file:
+            file.write(text)
+
+    print(json.dumps(report["summary"]))
+    return 0 if report["summary"].get("finished", 0) == len(files) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,7 @@ from bpy_extras.io_utils import ImportHelper
 
 from ....base.node import EG_Node
 from ....base.library import get_linked_cache, remove_linked_cache, add_linked_cache
+from ....base.objects import get_object, reset_objects
 
 from ....socket.derived import EGS_Array
 from ....socket.primitive import EGS_Value
@@ -49,7 +50,7 @@ class EGN_JoinMeshes(EG_Node):
 
         selected_objects = []
         for objectId in in_objectIds:
-            current_object = bpy.data.objects.get(objectId)
+            current_object = get_object(objectId)
             
             if current_object and current_object.type == "MESH":
                 current_object.select_set(True)
@@ -66,6 +67,7 @@ class EGN_JoinMeshes(EG_Node):
         self.prop_objectId = first_object.name
 
         bpy.ops.object.join()
+        reset_objects()
         bpy.context.view_layer.update()
 
         self.execute_next("success")
@@ -4,6 +4,7 @@ from bpy.props import ( BoolProperty, FloatProperty, EnumProperty, StringPropert
 
 from ....base.node import EG_Node
 from ....base.library import get_linked_cache, remove_linked_cache, add_linked_cache, is_vector
+from ....base.objects import add_object, push_undo
 
 from ....socket.derived import EGS_Array
 from ....socket.primitive import EGS_Value
@@ -48,7 +49,8 @@ class EGN_CreateMeshBase(EG_Node):
 
     def execute(self):
         bpy.context.view_layer.update()
-        bpy.ops.ed.undo_push()
+        push_undo()
+        add_object(bpy.context.object)
 
         self.prop_dataId = bpy.context.object.data.name
         self.prop_objectId = bpy.context.object.name
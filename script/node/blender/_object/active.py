@@ -3,6 +3,7 @@ from bpy.props import ( BoolProperty, FloatProperty, EnumProperty, StringPropert
 
 from ....base.node import EG_Node, EG_PureNode
 from ....base.library import create_enum, add_linked_cache, remove_linked_cache, get_linked_cache
+from ....base.objects import get_object
 
 from ....socket.derived import EGS_Array
 from ....socket.primitive import EGS_Value
@@ -15,6 +16,9 @@ class EGN_GetActiveObject(EG_PureNode):
     bl_label = "Get Active Object"
     bl_icon = "OBJECT_ORIGIN"
 
+    memoize = True
+    reads_scene = True
+
     def init(self, context):
         self.add_out("NodeSocketString", "object Id") # bind: object Id -> on_object_Id
 
@@ -37,8 +41,8 @@ class EGN_SetActiveObject(EG_Node):
         self.add_exec_out("failed")
     
     def execute(self):
-        in_objectId = str(self.get_input_value("object Id"))
-        object_data = bpy.data.objects.get(in_objectId)
+        in_objectId = self.get_input_value("object Id")
+        object_data = get_object(in_objectId)
 
         if object_data:
             bpy.context.view_layer.objects.active = object_data
@@ -91,6 +95,9 @@ class EGN_GetObjectMode(EG_PureNode):
     bl_label = "Get Object Mode"
     bl_icon = "TOOL_SETTINGS"
 
+    memoize = True
+    reads_scene = True
+
     def init(self, context):
         self.add_out("NodeSocketString", "mode") # bind: mode -> on_mode
 
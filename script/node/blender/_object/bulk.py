@@ -0,0 +1,259 @@
+import numpy
+import bpy
+from bpy.props import ( BoolProperty, FloatProperty, EnumProperty, StringProperty, IntProperty, PointerProperty, CollectionProperty, FloatVectorProperty )
+
+from ....base.node import EG_Node, EG_PureNode
+from ....base.objects import get_object, get_object_index, get_layout
+
+from ....socket.derived import EGS_Array
+from ....socket.primitive import EGS_Value
+
+
+# Share of the file's objects from which one pass over the whole
+# collection is cheaper than writing objects one by one
+bulk_ratio = 0.25
+
+# Plain float arrays, writing back unchanged values of other
+# objects is a no-op, unlike dimensions which rescale them
+bulk_attributes = { "location", "rotation_euler", "scale" }
+
+
+def read_layout(rebuild=False):
+    index = get_object_index()
+    if not index:
+        return get_layout()
+    if rebuild:
+        index.layout = None
+    return index.get_layout()
+
+
+def use_bulk(objects, attribute):
+    if attribute not in bulk_attributes or not objects or len(objects) < len(bpy.data.objects) * bulk_ratio:
+        return None
+
+    # Writing the whole collection writes linked objects
+    # too, which can't be edited, so skip files with any
+    positions, linked = read_layout()
+    return None if linked else positions
+
+
+def resolve_objects(items):
+    """Objects of handles or ids, with positions in the input of those which exist"""
+
+    objects = []
+    rows = []
+    for row, item in enumerate(items):
+        bl_object = get_object(item)
+        if bl_object:
+            objects.append(bl_object)
+            rows.append(row)
+    return objects, rows
+
+
+def get_positions(objects, positions):
+    try:
+        return numpy.fromiter((positions[obj.session_uid] for obj in objects), dtype=numpy.int64, count=len(objects))
+    except KeyError:
+        # Added by something else than the graph
+        # since the layout was read, read it again
+        positions, _ = read_layout(rebuild=True)
+        return numpy.fromiter((positions[obj.session_uid] for obj in objects), dtype=numpy.int64, count=len(objects))
+
+
+def read_vectors(objects, attribute):
+    """(N, 3) float array of an attribute of the objects"""
+
+    vectors = numpy.zeros((len(objects), 3), dtype=numpy.float32)
+
+    positions = use_bulk(objects, attribute)
+    if positions is not None:
+        total = len(bpy.data.objects)
+        buffer = numpy.empty(total * 3, dtype=numpy.float32)
+        bpy.data.objects.foreach_get(attribute, buffer)
+        vectors[:] = buffer.reshape(total, 3)[get_positions(objects, positions)]
+
+    else:
+        for row, bl_object in enumerate(objects):
+            vectors[row] = getattr(bl_object, attribute)
+
+    return vectors
+
+
+def write_vectors(objects, attribute, vectors):
+
+    # Read the whole collection, replace rows of the
+    # objects and write it back in one call
+    positions = use_bulk(objects, attribute)
+    if positions is not None:
+        total = len(bpy.data.objects)
+        buffer = numpy.empty(total * 3, dtype=numpy.float32)
+        bpy.data.objects.foreach_get(attribute, buffer)
+        buffer = buffer.reshape(total, 3)
+        buffer[get_positions(objects, positions)] = vectors
+        bpy.data.objects.foreach_set(attribute, buffer.ravel())
+
+        # Raw writes skip the update of each property,
+        # so tag the objects for the viewport to redraw them
+        for bl_object in objects:
+            bl_object.update_tag()
+        return
+
+    for bl_object, vector in zip(objects, vectors.tolist()):
+        setattr(bl_object, attribute, vector)
+
+
+class EGN_GetTransformsBase(EG_PureNode):
+    """Base of nodes reading a transform of many objects at once"""
+
+    memoize = True
+    reads_scene = True
+
+    attribute = "location"
+
+    def init(self, context):
+        self.add_in(EGS_Array.bl_idname, "objects")
+        self.add_out(EGS_Value.bl_idname, "values") # bind: values -> on_values
+
+    def on_values(self):
+        items = self.get_input_value("objects")
+        if not isinstance(items, (list, tuple)):
+            return numpy.zeros((0, 3), dtype=numpy.float32)
+
+        # Rows of removed objects stay zero
+        objects, rows = resolve_objects(items)
+        values = numpy.zeros((len(items), 3), dtype=numpy.float32)
+        values[rows] = read_vectors(objects, self.attribute)
+        return values
+
+
+class EGN_SetTransformsBase(EG_Node):
+    """Base of nodes writing a transform of many objects at once"""
+
+    attribute = "location"
+    default = (0.0, 0.0, 0.0)
+
+    def init(self, context):
+        self.add_exec_in("exec")
+        self.add_in(EGS_Array.bl_idname, "objects")
+        self.add_in(EGS_Value.bl_idname, "values")
+        self.add_in(socket="NodeSocketVector", name="vector", hide_value=False, default=self.default)
+        self.add_exec_out("success")
+        self.add_exec_out("failed")
+
+    def execute(self):
+        items = self.get_input_value("objects")
+        in_values = self.get_input_value("values")
+
+        if not isinstance(items, (list, tuple)):
+            self.execute_next("failed")
+            return
+
+        # Values are a (N, 3) buffer matching the objects,
+        # without them the vector is used for every object
+        if in_values is None:
+            values = numpy.broadcast_to(numpy.asarray(tuple(self.get_input_value("vector")), dtype=numpy.float32), (len(items), 3))
+        else:
+            values = numpy.asarray(in_values, dtype=numpy.float32)
+
+        if values.shape != (len(items), 3):
+            print(f"Expected {len(items)} vectors of 3 values, got shape {values.shape}")
+            self.execute_next("failed")
+            return
+
+        objects, rows = resolve_objects(items)
+        write_vectors(objects, self.attribute, values[rows])
+        self.execute_next("success")
+
+
+class EGN_GetLocations(EGN_GetTransformsBase):
+    """Get locations of many objects as a (N, 3) float array"""
+
+    bl_idname = "egn_object_get_locations"
+    bl_label = "Get Locations"
+    bl_icon = "OBJECT_ORIGIN"
+
+    attribute = "location"
+
+
+class EGN_SetLocations(EGN_SetTransformsBase):
+    """Set locations of many objects from a (N, 3) array or one vector"""
+
+    bl_idname = "egn_object_set_locations"
+    bl_label = "Set Locations"
+    bl_icon = "OBJECT_ORIGIN"
+
+    attribute = "location"
+
+
+class EGN_GetRotations(EGN_GetTransformsBase):
+    """Get rotations of many objects as a (N, 3) float array"""
+
+    bl_idname = "egn_object_get_rotations"
+    bl_label = "Get Rotations"
+    bl_icon = "OBJECT_ORIGIN"
+
+    attribute = "rotation_euler"
+
+
+class EGN_SetRotations(EGN_SetTransformsBase):
+    """Set rotations of many objects from a (N, 3) array or one vector"""
+
+    bl_idname = "egn_object_set_rotations"
+    bl_label = "Set Rotations"
+    bl_icon = "OBJECT_ORIGIN"
+
+    attribute = "rotation_euler"
+
+
+class EGN_GetScales(EGN_GetTransformsBase):
+    """Get scales of many objects as a (N, 3) float array"""
+
+    bl_idname = "egn_object_get_scales"
+    bl_label = "Get Scales"
+    bl_icon = "OBJECT_ORIGIN"
+
+    attribute = "scale"
+
+
+class EGN_SetScales(EGN_SetTransformsBase):
+    """Set scales of many objects from a (N, 3) array or one vector"""
+
+    bl_idname = "egn_object_set_scales"
+    bl_label = "Set Scales"
+    bl_icon = "OBJECT_ORIGIN"
+
+    attribute = "scale"
+    default = (1.0, 1.0, 1.0)
+
+
+class EGN_GetDimensions(EGN_GetTransformsBase):
+    """Get dimensions of many objects as a (N, 3) float array"""
+
+    bl_idname = "egn_object_get_dimensions"
+    bl_label = "Get Dimensions"
+    bl_icon = "OBJECT_ORIGIN"
+
+    attribute = "dimensions"
+
+
+class EGN_SetDimensions(EGN_SetTransformsBase):
+    """Set dimensions of many objects from a (N, 3) array or one vector"""
+
+    bl_idname = "egn_object_set_dimensions"
+    bl_label = "Set Dimensions"
+    bl_icon = "OBJECT_ORIGIN"
+
+    attribute = "dimensions"
+    default = (1.0, 1.0, 1.0)
+
+
+classes = [
+    EGN_GetLocations,
+    EGN_SetLocations,
+    EGN_GetRotations,
+    EGN_SetRotations,
+    EGN_GetScales,
+    EGN_SetScales,
+    EGN_GetDimensions,
+    EGN_SetDimensions,
+]
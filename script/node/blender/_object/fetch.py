@@ -2,12 +2,18 @@ import bpy
 from bpy.props import ( BoolProperty, FloatProperty, EnumProperty, StringProperty, IntProperty, PointerProperty, CollectionProperty, FloatVectorProperty )
 
 from ....base.node import EG_Node, EG_PureNode
-from ....base.library import create_enum, add_linked_cache, remove_linked_cache, get_linked_cache
+from ....base.library import create_enum, add_linked_cache, remove_linked_cache, get_linked_cache, get_kept_cache, keep_linked_cache
+from ....base.objects import get_object, get_object_type, get_object_parent, get_object_names, watch_objects, OBJECT_LIST
 
 from ....socket.derived import EGS_Array
 from ....socket.primitive import EGS_Value
 
 
+# Object lists are kept until objects are
+# added, removed or renamed
+OBJECT_DEPENDS = (OBJECT_LIST,)
+
+
 class EGN_GetObjectId(EG_PureNode):
     """Get the object id"""
     
@@ -15,6 +21,9 @@ class EGN_GetObjectId(EG_PureNode):
     bl_label = "Get Object Id"
     bl_icon = "OBJECT_ORIGIN"
 
+    memoize = True
+    reads_scene = True
+
     target_object: PointerProperty(name="Object", type=bpy.types.Object) # type: ignore
 
     def init(self, context):
@@ -34,24 +43,29 @@ class EGN_GetDataId(EG_PureNode):
     bl_label = "Get Data Id"
     bl_icon = "RNA"
 
+    memoize = True
+    reads_scene = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "object Id")
         self.add_out("NodeSocketString", "data Id") # bind: data Id -> on_data_Id
 
     def on_data_Id(self):
-        in_objectId = str(self.get_input_value("object Id"))
-        bl_object = bpy.data.objects.get(in_objectId)
+        in_objectId = self.get_input_value("object Id")
+        bl_object = get_object(in_objectId)
 
         return bl_object.data.name if bl_object and bl_object.data else ""
 
 
 class EGN_GetAllObjects(EG_Node):
-    """Gets a list of all objects. This node may be unreliable if objects are modified externally, as the cached list will not reflect those changes"""
+    """Gets a list of all objects, the list is reused until objects change"""
     
     bl_idname = "egn_object_get_all"
     bl_label = "Get All Objects"
     bl_icon = "OBJECT_ORIGIN"
 
+    reads_scene = True
+
     def init(self, context):
         self.add_exec_in("exec")
         self.add_exec_out("exec")
@@ -62,8 +76,16 @@ class EGN_GetAllObjects(EG_Node):
         return cache_value if cache_value else []
 
     def execute(self):
-        object_Ids = [obj.name for obj in bpy.data.objects]
-        add_linked_cache(self, "object Ids", object_Ids)
+        kept = get_kept_cache(self, "object Ids")
+
+        # Nodes downstream may change the list in
+        # place, so every run gets its own copy
+        if kept is None:
+            kept = tuple(get_object_names())
+            keep_linked_cache(self, "object Ids", kept, OBJECT_DEPENDS)
+            watch_objects()
+
+        add_linked_cache(self, "object Ids", list(kept))
         self.execute_next("exec")
 
     def free(self):
@@ -77,6 +99,8 @@ class EGN_FilterObjects(EG_Node):
     bl_label = "Filter Objects"
     bl_icon = "FILTER"
 
+    reads_scene = True
+
     prop_type: EnumProperty(
         name="Type",
         items=[
@@ -118,9 +142,20 @@ class EGN_FilterObjects(EG_Node):
         if not isinstance(objects_Ids, list):
             objects_Ids = []
 
-        filtered_Ids = [obj for obj in objects_Ids if obj in bpy.data.objects and bpy.data.objects[obj].type == self.prop_type]
+        # Reuse the last result while the input
+        # and the objects are the same
+        objects_Ids = tuple(objects_Ids)
+        kept = get_kept_cache(self, "object Ids")
 
-        add_linked_cache(self, "object Ids", filtered_Ids)
+        if kept and kept[0] == self.prop_type and kept[1] == objects_Ids:
+            filtered_Ids = kept[2]
+
+        else:
+            filtered_Ids = tuple(obj for obj in objects_Ids if get_object_type(obj) == self.prop_type)
+            keep_linked_cache(self, "object Ids", (self.prop_type, objects_Ids, filtered_Ids), OBJECT_DEPENDS)
+            watch_objects()
+
+        add_linked_cache(self, "object Ids", list(filtered_Ids))
         self.execute_next("exec")
 
     def free(self):
@@ -134,6 +169,8 @@ class EGN_IsObjectValid(EG_Node):
     bl_label = "Is Object Valid"
     bl_icon = "OBJECT_DATA"
 
+    reads_scene = True
+
     def init(self, context):
         self.add_exec_in("exec")
         self.add_in("NodeSocketString", "object Id")
@@ -141,8 +178,8 @@ class EGN_IsObjectValid(EG_Node):
         self.add_exec_out("invalid")
     
     def execute(self):
-        in_objectId = str(self.get_input_value("object Id"))
-        if bpy.data.objects.get(in_objectId):
+        in_objectId = self.get_input_value("object Id")
+        if get_object(in_objectId):
             self.execute_next("valid")
 
         else:
@@ -156,15 +193,16 @@ class EGN_GetParent(EG_PureNode):
     bl_label = "Get Parent"
     bl_icon = "OBJECT_ORIGIN"
 
+    memoize = True
+    reads_scene = True
+
     def init(self, context):
         self.add_in(socket="NodeSocketString", name="object Id")
         self.add_out(socket="NodeSocketString", name="parent Id") # bind: parent Id -> on_parent_Id
     
     def on_parent_Id(self):
-        in_objectId = str(self.get_input_value("object Id"))
-        bl_object = bpy.data.objects.get(in_objectId)
-
-        return bl_object.parent.name if bl_object and bl_object.parent else ""
+        in_objectId = self.get_input_value("object Id")
+        return get_object_parent(in_objectId) or ""
 
 
 class EGN_GetChildren(EG_PureNode):
@@ -174,13 +212,16 @@ class EGN_GetChildren(EG_PureNode):
     bl_label = "Get Children"
     bl_icon = "OBJECT_ORIGIN"
 
+    memoize = True
+    reads_scene = True
+
     def init(self, context):
         self.add_in(socket="NodeSocketString", name="object Id")
         self.add_out(socket=EGS_Array.bl_idname, name="children Ids") # bind: children Ids -> on_children_Ids
     
     def on_children_Ids(self):
-        in_objectId = str(self.get_input_value("object Id"))
-        bl_object = bpy.data.objects.get(in_objectId)
+        in_objectId = self.get_input_value("object Id")
+        bl_object = get_object(in_objectId)
 
         if bl_object and bl_object.children:
             return [child.name for child in bl_object.children]
@@ -0,0 +1,104 @@
+import bpy
+from bpy.props import ( BoolProperty, FloatProperty, EnumProperty, StringProperty, IntProperty, PointerProperty, CollectionProperty, FloatVectorProperty )
+
+from ....base.node import EG_PureNode
+from ....base.objects import to_handle
+
+from ....socket.derived import EGS_Array
+from ....socket.primitive import EGS_Value
+from ....socket.user import EGS_ObjectHandle
+
+
+class EGN_ToObjectHandle(EG_PureNode):
+    """Get a handle of an object by its id, which stays valid when it is renamed"""
+    
+    bl_idname = "egn_object_to_handle"
+    bl_label = "To Object Handle"
+    bl_icon = "LINKED"
+
+    memoize = True
+    reads_scene = True
+
+    def init(self, context):
+        self.add_in(EGS_Value.bl_idname, "object Id")
+        self.add_out(EGS_ObjectHandle.bl_idname, "handle") # bind: handle -> on_handle
+
+    def on_handle(self):
+        return to_handle(self.get_input_value("object Id"))
+
+
+class EGN_ToObjectId(EG_PureNode):
+    """Get the current id of the object a handle points to"""
+    
+    bl_idname = "egn_object_handle_to_id"
+    bl_label = "To Object Id"
+    bl_icon = "LINKED"
+
+    memoize = True
+    reads_scene = True
+
+    def init(self, context):
+        self.add_in(EGS_ObjectHandle.bl_idname, "handle")
+        self.add_out("NodeSocketString", "object Id") # bind: object Id -> on_object_Id
+        self.add_out("NodeSocketBool", "valid") # bind: valid -> on_valid
+
+    def on_object_Id(self):
+        handle = to_handle(self.get_input_value("handle"))
+        return handle.name if handle else ""
+
+    def on_valid(self):
+        return to_handle(self.get_input_value("handle")) is not None
+
+
+class EGN_ToObjectHandles(EG_PureNode):
+    """Get handles of a list of objects, ids of missing objects are left out"""
+    
+    bl_idname = "egn_object_to_handles"
+    bl_label = "To Object Handles"
+    bl_icon = "LINKED"
+
+    memoize = True
+    reads_scene = True
+
+    def init(self, context):
+        self.add_in(EGS_Array.bl_idname, "object Ids")
+        self.add_out(EGS_Array.bl_idname, "handles") # bind: handles -> on_handles
+
+    def on_handles(self):
+        items = self.get_input_value("object Ids")
+        if not isinstance(items, list):
+            return []
+
+        handles = [to_handle(item) for item in items]
+        return [handle for handle in handles if handle]
+
+
+class EGN_ToObjectIds(EG_PureNode):
+    """Get current ids of a list of handles, removed objects are left out"""
+    
+    bl_idname = "egn_object_handles_to_ids"
+    bl_label = "To Object Ids"
+    bl_icon = "LINKED"
+
+    memoize = True
+    reads_scene = True
+
+    def init(self, context):
+        self.add_in(EGS_Array.bl_idname, "handles")
+        self.add_out(EGS_Array.bl_idname, "object Ids") # bind: object Ids -> on_object_Ids
+
+    def on_object_Ids(self):
+        items = self.get_input_value("handles")
+        if not isinstance(items, list):
+            return []
+
+        handles = [to_handle(item) for item in items]
+        return [handle.name for handle in handles if handle]
+
+
+classes = [
+    EGN_ToObjectHandle,
+    EGN_ToObjectId,
+    EGN_ToObjectHandles,
+    EGN_ToObjectIds,
+]
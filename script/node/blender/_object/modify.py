@@ -2,7 +2,9 @@ import bpy
 from bpy.props import ( BoolProperty, FloatProperty, EnumProperty, StringProperty, IntProperty, PointerProperty, CollectionProperty, FloatVectorProperty )
 
 from ....base.node import EG_Node, EG_PureNode
+from ....base.frame import report_error
 from ....base.library import add_linked_cache, remove_linked_cache, get_linked_cache
+from ....base.objects import get_object, rename_object, remove_object, remove_objects, reset_objects, add_object, reparent_object, push_undo
 
 from ....socket.derived import EGS_Array
 from ....socket.primitive import EGS_Value
@@ -23,13 +25,15 @@ class EGN_RenameObject(EG_Node):
         self.add_exec_out("failed")
 
     def execute(self):
-        in_objectId = str(self.get_input_value("object Id"))
+        in_objectId = self.get_input_value("object Id")
         in_name = str(self.get_input_value("name"))
 
-        bl_object = bpy.data.objects.get(in_objectId)
+        bl_object = get_object(in_objectId)
 
         if bl_object:
+            old_name = bl_object.name
             bl_object.name = in_name
+            rename_object(old_name, bl_object)
             self.execute_next("success")
 
         else:
@@ -51,10 +55,10 @@ class EGN_RenameData(EG_Node):
         self.add_exec_out("failed")
 
     def execute(self):
-        in_objectId = str(self.get_input_value("object Id"))
+        in_objectId = self.get_input_value("object Id")
         in_name = str(self.get_input_value("name"))
 
-        bl_object = bpy.data.objects.get(in_objectId)
+        bl_object = get_object(in_objectId)
 
         if bl_object and bl_object.data:
             bl_object.data.name = in_name
@@ -78,12 +82,14 @@ class EGN_DeleteObject(EG_Node):
         self.add_exec_out("failed")
 
     def execute(self):
-        in_objectId = str(self.get_input_value("object Id"))
-        bl_object = bpy.data.objects.get(in_objectId)
+        in_objectId = self.get_input_value("object Id")
+        bl_object = get_object(in_objectId)
 
         if bl_object:
+            old_name = bl_object.name
             bpy.data.objects.remove(bl_object, do_unlink=True)
-            bpy.ops.ed.undo_push()
+            remove_object(old_name)
+            push_undo()
 
             self.execute_next("success")
             
@@ -91,6 +97,60 @@ class EGN_DeleteObject(EG_Node):
             self.execute_next("failed")
 
 
+class EGN_DeleteObjects(EG_Node):
+    """Delete many objects at once"""
+    
+    bl_idname = "egn_object_delete_batch"
+    bl_label = "Delete Objects"
+    bl_icon = "OBJECT_ORIGIN"
+
+    def init(self, context):
+        self.add_exec_in("exec")
+        self.add_in(EGS_Array.bl_idname, "objects")
+        self.add_in(socket="NodeSocketBool", name="purge orphans", hide_value=False, default=False)
+        self.add_exec_out("success")
+        self.add_exec_out("failed")
+        self.add_out("NodeSocketInt", "count") # bind: count -> on_count
+
+    def on_count(self):
+        return get_linked_cache(self, "count") or 0
+
+    def execute(self):
+        items = self.get_input_value("objects")
+        in_purge = bool(self.get_input_value("purge orphans"))
+
+        if not isinstance(items, (list, tuple)):
+            self.execute_next("failed")
+            return
+
+        # Same object may be listed more than once, objects
+        # of different libraries may share a name
+        objects = {}
+        for item in items:
+            bl_object = get_object(item)
+            if bl_object:
+                objects[bl_object.session_uid] = bl_object
+
+        try:
+            bpy.data.batch_remove(list(objects.values()))
+        except (RuntimeError, ReferenceError) as e:
+            report_error(self.name, e)
+            self.execute_next("failed")
+            return
+
+        remove_objects(set(objects))
+        push_undo()
+
+        # Purge may remove objects which had no users,
+        # the index is rebuilt by the next lookup
+        if in_purge:
+            bpy.data.orphans_purge(do_local_ids=True, do_linked_ids=False, do_recursive=True)
+            reset_objects()
+
+        add_linked_cache(self, "count", len(objects))
+        self.execute_next("success")
+
+
 class EGN_DuplicateObject(EG_Node):
     """Duplicate an object"""
     
@@ -114,8 +174,8 @@ class EGN_DuplicateObject(EG_Node):
         try:
             self.prop_objectId = ""
 
-            in_objectId = str(self.get_input_value("object Id"))
-            object_data = bpy.data.objects.get(in_objectId)
+            in_objectId = self.get_input_value("object Id")
+            object_data = get_object(in_objectId)
 
             if not object_data:
                 raise Exception("Object not found")
@@ -124,7 +184,8 @@ class EGN_DuplicateObject(EG_Node):
             new_object.data = object_data.data.copy()
 
             bpy.context.collection.objects.link(new_object)
-            bpy.ops.ed.undo_push()
+            add_object(new_object)
+            push_undo()
 
             self.prop_objectId = new_object.name
             self.execute_next("success")
@@ -149,14 +210,15 @@ class EGN_SetParent(EG_Node):
         self.add_exec_out("failed")
     
     def execute(self):
-        in_objectId = str(self.get_input_value("object Id"))
-        in_parentId = str(self.get_input_value("parent Id"))
+        in_objectId = self.get_input_value("object Id")
+        in_parentId = self.get_input_value("parent Id")
 
-        object_data = bpy.data.objects.get(in_objectId)
-        parent_data = bpy.data.objects.get(in_parentId)
+        object_data = get_object(in_objectId)
+        parent_data = get_object(in_parentId)
 
         if object_data and parent_data:
             object_data.parent = parent_data
+            reparent_object(object_data.name, parent_data.name)
             self.execute_next("success")
             
         else:
@@ -177,11 +239,12 @@ class EGN_ClearParent(EG_Node):
         self.add_exec_out("failed")
     
     def execute(self):
-        in_objectId = str(self.get_input_value("object Id"))
-        object_data = bpy.data.objects.get(in_objectId)
+        in_objectId = self.get_input_value("object Id")
+        object_data = get_object(in_objectId)
 
         if object_data:
             object_data.parent = None
+            reparent_object(object_data.name, "")
             self.execute_next("success")
             
         else:
@@ -192,6 +255,7 @@ classes = [
     EGN_RenameObject,
     EGN_RenameData,
     EGN_DeleteObject,
+    EGN_DeleteObjects,
     EGN_DuplicateObject,
     EGN_SetParent,
     EGN_ClearParent,
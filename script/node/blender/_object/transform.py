@@ -4,6 +4,7 @@ from bpy.props import ( BoolProperty, FloatProperty, EnumProperty, StringPropert
 
 from ....base.node import EG_Node, EG_PureNode
 from ....base.library import add_linked_cache, remove_linked_cache, get_linked_cache, is_vector
+from ....base.objects import get_object
 from ....socket.derived import EGS_Array
 from ....socket.primitive import EGS_Value
 
@@ -15,13 +16,16 @@ class EGN_GetLocation(EG_PureNode):
     bl_label = "Get Location"
     bl_icon = "OBJECT_ORIGIN"
 
+    memoize = True
+    reads_scene = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "object Id")
         self.add_out("NodeSocketVectorXYZ", "location") # bind: location -> on_location
 
     def on_location(self):
-        in_objectId = str(self.get_input_value("object Id"))
-        bl_object = bpy.data.objects.get(in_objectId)
+        in_objectId = self.get_input_value("object Id")
+        bl_object = get_object(in_objectId)
 
         if not bl_object.location:
             return tuple((0.0, 0.0, 0.0))
@@ -44,10 +48,10 @@ class EGN_SetLocation(EG_Node):
         self.add_exec_out("failed")
 
     def execute(self):
-        in_objectId = str(self.get_input_value("object Id"))
+        in_objectId = self.get_input_value("object Id")
         in_location = tuple(self.get_input_value("location"))
 
-        bl_object = bpy.data.objects.get(in_objectId)
+        bl_object = get_object(in_objectId)
 
         if bl_object and is_vector(in_location, 3):
             bl_object.location = in_location
@@ -64,13 +68,16 @@ class EGN_GetRotation(EG_PureNode):
     bl_label = "Get Rotation"
     bl_icon = "OBJECT_ORIGIN"
 
+    memoize = True
+    reads_scene = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "object Id")
         self.add_out("NodeSocketVectorEuler", "rotation") # bind: rotation -> on_rotation
 
     def on_rotation(self):
-        in_objectId = str(self.get_input_value("object Id"))
-        bl_object = bpy.data.objects.get(in_objectId)
+        in_objectId = self.get_input_value("object Id")
+        bl_object = get_object(in_objectId)
 
         if not bl_object.rotation_euler:
             return tuple((0.0, 0.0, 0.0))
@@ -93,10 +100,10 @@ class EGN_SetRotation(EG_Node):
         self.add_exec_out("failed")
 
     def execute(self):
-        in_objectId = str(self.get_input_value("object Id"))
+        in_objectId = self.get_input_value("object Id")
         in_rotation = tuple(self.get_input_value("rotation"))
 
-        bl_object = bpy.data.objects.get(in_objectId)
+        bl_object = get_object(in_objectId)
 
         if bl_object and is_vector(in_rotation, 3):
             bl_object.rotation_euler = in_rotation
@@ -113,13 +120,16 @@ class EGN_GetScale(EG_PureNode):
     bl_label = "Get Scale"
     bl_icon = "OBJECT_ORIGIN"
 
+    memoize = True
+    reads_scene = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "object Id")
         self.add_out("NodeSocketVector", "scale") # bind: scale -> on_scale
 
     def on_scale(self):
-        in_objectId = str(self.get_input_value("object Id"))
-        bl_object = bpy.data.objects.get(in_objectId)
+        in_objectId = self.get_input_value("object Id")
+        bl_object = get_object(in_objectId)
 
         if not bl_object.scale:
             return tuple((0.0, 0.0, 0.0))
@@ -142,10 +152,10 @@ class EGN_SetScale(EG_Node):
         self.add_exec_out("failed")
 
     def execute(self):
-        in_objectId = str(self.get_input_value("object Id"))
+        in_objectId = self.get_input_value("object Id")
         in_scale = tuple(self.get_input_value("scale"))
         
-        bl_object = bpy.data.objects.get(in_objectId)
+        bl_object = get_object(in_objectId)
         
         if bl_object and is_vector(in_scale, 3):
             bl_object.scale = in_scale
@@ -162,13 +172,16 @@ class EGN_GetDimension(EG_PureNode):
     bl_label = "Get Dimension"
     bl_icon = "OBJECT_ORIGIN"
 
+    memoize = True
+    reads_scene = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "object Id")
         self.add_out("NodeSocketVector", "dimension") # bind: dimension -> on_dimension
 
     def on_dimension(self):
-        in_objectId = str(self.get_input_value("object Id"))
-        bl_object = bpy.data.objects.get(in_objectId)
+        in_objectId = self.get_input_value("object Id")
+        bl_object = get_object(in_objectId)
 
         if not bl_object.dimensions:
             return tuple((0.0, 0.0, 0.0))
@@ -191,10 +204,10 @@ class EGN_SetDimension(EG_Node):
         self.add_exec_out("failed")
     
     def execute(self):
-        in_objectId = str(self.get_input_value("object Id"))
+        in_objectId = self.get_input_value("object Id")
         in_dimension = tuple(self.get_input_value("dimension"))
 
-        bl_object = bpy.data.objects.get(in_objectId)
+        bl_object = get_object(in_objectId)
 
         if bl_object and bl_object.dimensions and is_vector(in_dimension, 3):
             bl_object.dimensions = in_dimension
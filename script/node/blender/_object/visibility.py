@@ -2,6 +2,7 @@ import bpy
 from bpy.props import ( BoolProperty, FloatProperty, EnumProperty, StringProperty, IntProperty, PointerProperty, CollectionProperty, FloatVectorProperty )
 
 from ....base.node import EG_Node, EG_PureNode
+from ....base.objects import get_object
 
 from ....socket.derived import EGS_Array
 from ....socket.primitive import EGS_Value
@@ -14,13 +15,16 @@ class EGN_GetViewportVisibility(EG_PureNode):
     bl_label = "Get Viewport Visibility"
     bl_icon = "HIDE_OFF"
 
+    memoize = True
+    reads_scene = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "object Id")
         self.add_out("NodeSocketBool", "visible") # bind: visible -> on_visible
 
     def on_visible(self):
-        in_objectId = str(self.get_input_value("object Id"))
-        bl_object = bpy.data.objects.get(in_objectId)
+        in_objectId = self.get_input_value("object Id")
+        bl_object = get_object(in_objectId)
 
         if bl_object:
             return not bl_object.hide_viewport
@@ -43,10 +47,10 @@ class EGN_SetViewportVisibility(EG_Node):
         self.add_exec_out("failed")
 
     def execute(self):
-        in_objectId = str(self.get_input_value("object Id"))
+        in_objectId = self.get_input_value("object Id")
         in_visible = bool(self.get_input_value("visible"))
 
-        bl_object = bpy.data.objects.get(in_objectId)
+        bl_object = get_object(in_objectId)
 
         if bl_object:
             bl_object.hide_viewport = not in_visible
@@ -63,13 +67,16 @@ class EGN_GetRenderVisibility(EG_PureNode):
     bl_label = "Get Render Visibility"
     bl_icon = "RESTRICT_RENDER_OFF"
 
+    memoize = True
+    reads_scene = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "object Id")
         self.add_out("NodeSocketBool", "visible") # bind: visible -> on_visible
 
     def on_visible(self):
-        in_objectId = str(self.get_input_value("object Id"))
-        bl_object = bpy.data.objects.get(in_objectId)
+        in_objectId = self.get_input_value("object Id")
+        bl_object = get_object(in_objectId)
 
         if bl_object:
             return not bl_object.hide_render
@@ -92,10 +99,10 @@ class EGN_SetRenderVisibility(EG_Node):
         self.add_exec_out("failed")
 
     def execute(self):
-        in_objectId = str(self.get_input_value("object Id"))
+        in_objectId = self.get_input_value("object Id")
         in_visible = bool(self.get_input_value("visible"))
 
-        bl_object = bpy.data.objects.get(in_objectId)
+        bl_object = get_object(in_objectId)
 
         if bl_object:
             bl_object.hide_render = not in_visible
@@ -3,6 +3,7 @@ from bpy.props import ( BoolProperty, FloatProperty, EnumProperty, StringPropert
 
 from ...base.node import EG_Node
 from ...base.library import get_linked_cache, remove_linked_cache, add_linked_cache, is_vector
+from ...base.objects import get_object, add_object
 
 from ...socket.primitive import EGS_Value
 
@@ -70,8 +71,8 @@ class EGN_CreateLight(EG_Node):
             light_data.energy = in_intensity
             light_data.use_shadow = in_shadow
 
-            light_object = bpy.data.objects.get(in_name)
-            if in_name in bpy.data.objects:
+            light_object = get_object(in_name)
+            if light_object:
                 raise Exception("Light object already exists")
             
             light_object = bpy.data.objects.new(in_name, light_data)
@@ -80,6 +81,8 @@ class EGN_CreateLight(EG_Node):
                 bpy.context.scene.collection.objects.link(light_object)
                 light_object.location = in_location
 
+            add_object(light_object)
+
             bpy.context.view_layer.update()
 
             self.prop_dataId = light_data.name
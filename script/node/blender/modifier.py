@@ -1,8 +1,9 @@
 import bpy
 from bpy.props import ( BoolProperty, FloatProperty, EnumProperty, StringProperty, IntProperty, PointerProperty, CollectionProperty, FloatVectorProperty )
 
-from ...base.node import EG_Node, EG_PureNode
+from ...base.node import EG_Node, EG_PureNode, update_node
 from ...base.library import get_linked_cache, remove_linked_cache, add_linked_cache, is_vector
+from ...base.objects import get_object
 
 from ...socket.user import EGS_Modifier
 from ...socket.derived import EGS_Array
@@ -16,13 +17,16 @@ class EGN_GetAllModifiers(EG_PureNode):
     bl_label = "Get All Modifiers"
     bl_icon = "MOD_DECIM"
 
+    memoize = True
+    reads_scene = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "object Id")
         self.add_out(socket=EGS_Modifier.bl_idname, name="modifiers", is_array=True) # bind: modifiers -> on_modifiers
 
     def on_modifiers(self):
-        in_objectId = str(self.get_input_value("object Id"))
-        bl_object = bpy.data.objects.get(in_objectId)
+        in_objectId = self.get_input_value("object Id")
+        bl_object = get_object(in_objectId)
         
         if bl_object and bl_object.type == "MESH":
             return list(bl_object.modifiers)
@@ -37,16 +41,19 @@ class EGN_GetModifier(EG_PureNode):
     bl_label = "Get Modifier"
     bl_icon = "MOD_DECIM"
 
+    memoize = True
+    reads_scene = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "object Id")
         self.add_in(socket="NodeSocketInt", name="index", hide_value=False)
         self.add_out(EGS_Modifier.bl_idname, "modifier") # bind: modifier -> on_modifier
 
     def on_modifier(self):
-        in_objectId = str(self.get_input_value("object Id"))
+        in_objectId = self.get_input_value("object Id")
         in_index = int(self.get_input_value("index"))
 
-        bl_object = bpy.data.objects.get(in_objectId)
+        bl_object = get_object(in_objectId)
 
         if bl_object:
             if 0 <= in_index < len(bl_object.modifiers):
@@ -63,9 +70,12 @@ class EGN_FilterModifiers(EG_PureNode):
     bl_icon = "MOD_DECIM"
     bl_width_default = 225
 
+    memoize = True
+
     prop_type: EnumProperty(
         name="Type",
-        items=[(modifier.identifier, modifier.name, "") for modifier in bpy.types.Modifier.bl_rna.properties["type"].enum_items]
+        items=[(modifier.identifier, modifier.name, "") for modifier in bpy.types.Modifier.bl_rna.properties["type"].enum_items],
+        update=update_node
     ) # type: ignore
 
     def init(self, context):
@@ -98,10 +108,10 @@ class EGN_RemoveModifier(EG_Node):
         self.add_exec_out("error")
 
     def execute(self):
-        in_objectId = str(self.get_input_value("object Id"))
+        in_objectId = self.get_input_value("object Id")
         in_modifier = self.get_input_value("modifier")
 
-        bl_object = bpy.data.objects.get(in_objectId)
+        bl_object = get_object(in_objectId)
 
         if bl_object and in_modifier:
             bl_object.modifiers.remove(in_modifier)
@@ -126,10 +136,10 @@ class EGN_RemoveModifierByIndex(EG_Node):
         self.add_exec_out("error")
 
     def execute(self):
-        in_objectId = str(self.get_input_value("object Id"))
+        in_objectId = self.get_input_value("object Id")
         in_index = int(self.get_input_value("index"))
 
-        bl_object = bpy.data.objects.get(in_objectId)
+        bl_object = get_object(in_objectId)
 
         if bl_object:
             if 0 <= in_index < len(bl_object.modifiers):
@@ -3,10 +3,14 @@ from ._object.modify import classes as modify_classes
 from ._object.active import classes as active_classes
 from ._object.visibility import classes as visibility_classes
 from ._object.transform import classes as transform_classes
+from ._object.handle import classes as handle_classes
+from ._object.bulk import classes as bulk_classes
 
 classes = []
 classes += fetch_classes
 classes += modify_classes
 classes += active_classes
 classes += visibility_classes
-classes += transform_classes
\ No newline at end of file
+classes += transform_classes
+classes += handle_classes
+classes += bulk_classes
\ No newline at end of file
@@ -2,7 +2,7 @@ import uuid
 import bpy
 from bpy.props import ( BoolProperty, FloatProperty, EnumProperty, StringProperty, IntProperty, PointerProperty, CollectionProperty, FloatVectorProperty )
 
-from ...base.node import EG_PureNode, EG_Node
+from ...base.node import EG_PureNode, EG_Node, update_node
 from ...base.library import create_enum, add_cache, get_cache
 
 from ...socket.derived import EGS_Array
@@ -15,6 +15,8 @@ class EGN_MakeArray(EG_PureNode):
     bl_idname = "egn_python_make_array"
     bl_label = "Make Array"
 
+    memoize = True
+
     def init(self, context):
         self.add_in(EGS_Value.bl_idname, "item", 100)
         self.add_out(EGS_Array.bl_idname, "array")
@@ -28,6 +30,8 @@ class EGN_ArrayMerge(EG_PureNode):
     
     bl_idname = "egn_python_array_merge"
     bl_label = "Merge"
+
+    memoize = True
     
     def init(self, context):
         self.add_in(EGS_Array.bl_idname, "a")
@@ -79,6 +83,8 @@ class EGN_ArrayCount(EG_PureNode):
     
     bl_idname = "egn_python_array_count"
     bl_label = "Count"
+
+    memoize = True
     
     def init(self, context):
         self.add_in(EGS_Array.bl_idname, "array")
@@ -96,6 +102,8 @@ class EGN_ArrayIndex(EG_PureNode):
     
     bl_idname = "egn_python_array_index"
     bl_label = "Index"
+
+    memoize = True
     
     def init(self, context):
         self.add_in(EGS_Array.bl_idname, "array")
@@ -184,7 +192,9 @@ class EGN_ArraySort(EG_PureNode):
     bl_idname = "egn_python_array_sort"
     bl_label = "Sort"
 
-    reverse = bpy.props.BoolProperty(name="Reverse", default=False)
+    memoize = True
+
+    reverse: BoolProperty(name="Reverse", default=False, update=update_node) # type: ignore
     
     def init(self, context):
         self.add_in(EGS_Array.bl_idname, "array")
@@ -195,8 +205,7 @@ class EGN_ArraySort(EG_PureNode):
 
     def on_array(self):
         items = self.get_input_value("array")
-        items.sort(reverse=self.reverse)
-        return items
+        return sorted(items, reverse=self.reverse)
 
 
 class EGN_ArrayGet(EG_PureNode):
@@ -244,6 +253,8 @@ class EGN_ArrayLength(EG_PureNode):
     
     bl_idname = "egn_python_array_length"
     bl_label = "Length"
+
+    memoize = True
     
     def init(self, context):
         self.add_in(EGS_Array.bl_idname, "array")
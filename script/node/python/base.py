@@ -2,8 +2,9 @@ import uuid
 import bpy
 from bpy.props import ( BoolProperty, FloatProperty, EnumProperty, StringProperty, IntProperty, PointerProperty, CollectionProperty, FloatVectorProperty )
 
-from ...base.node import EG_Node
-from ...base.library import create_enum
+from ...base.node import EG_Node, execute_plan
+from ...base.library import create_enum, get_preference
+from ...base.compiler import get_plan
 
 from ...socket.user import EGS_Object
 from ...socket.primitive import EGS_Value
@@ -15,7 +16,7 @@ from ...operator.exec_main import EGOP_ExecuteMain
     
 def get_graphs(self, context):
     """Dynamically fetch all graphs of type EG_NodeTree."""
-    graphs = [(tree.name, tree.name, "") for tree in bpy.data.node_groups if tree.bl_idname == "EG_NodeTree"]
+    graphs = [(tree.name, tree.name, "") for tree in bpy.data.node_groups if tree.bl_idname == "eg_nodetree"]
     return graphs if graphs else [("None", "None", "No graphs available")]
 
 
@@ -27,6 +28,9 @@ class EGN_CallGraph(EG_Node):
     bl_idname = "EGN_CallGraph"
     bl_label = "Call Graph"
 
+    # Edits of the called graph are not tracked
+    replay = False
+
     selected_graph: EnumProperty(
         name="Graph",
         description="Select an Event Graph",
@@ -45,9 +49,13 @@ class EGN_CallGraph(EG_Node):
     def execute(self):
         graph = bpy.data.node_groups.get(self.selected_graph)
         if graph:
+            preference = get_preference()
+
+            # Each function runs to completion in its own
+            # frame, so its node data never mixes with ours
             for node in graph.nodes:
-                if node.bl_idname == "EGN_Definition" and hasattr(node, "execute"):
-                    node.execute()
+                if node.bl_idname == "egn_python_function":
+                    execute_plan(get_plan(node, preference.memoize_pure, preference.profile_nodes, preference.trace_runs, preference.persist_pure))
 
         self.execute_next("exec")
 
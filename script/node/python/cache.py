@@ -2,8 +2,10 @@ import uuid
 import bpy
 from bpy.props import ( BoolProperty, FloatProperty, EnumProperty, StringProperty, IntProperty, PointerProperty, CollectionProperty, FloatVectorProperty )
 
-from ...base.node import EG_Node, EG_PureNode
-from ...base.library import add_cache, get_cache, remove_cache, flush_cache, cache_map
+from ...base.node import EG_Node, EG_PureNode, update_node
+from ...base.library import add_cache, get_cache, remove_cache, flush_cache
+from ...base.cache import cache_store, describe_cache
+from ...base.frame import active_frame
 from ...socket.primitive import EGS_Value
 
 
@@ -14,16 +16,33 @@ class EGN_SetCache(EG_Node):
     bl_label = "Set Cache"
     bl_icon = "PACKAGE"
 
+    # User cache is flushed before every run
+    replay = False
+
+    pinned: BoolProperty(name="Pin", description="Never evict this entry when the cache is full", default=True) # type: ignore
+    ttl: FloatProperty(name="TTL", description="Seconds until the entry expires, 0 to keep it", default=0.0, min=0.0, subtype="TIME") # type: ignore
+    use_disk: BoolProperty(name="Disk", description="Also save the value next to the blend file", default=False) # type: ignore
+    version: StringProperty(name="Version", description="Key stored with the file, a different key invalidates it") # type: ignore
+
     def init(self, context):
         self.add_exec_in("exec")
         self.add_in("NodeSocketString", "name", 1, False)
         self.add_in(EGS_Value.bl_idname, "value")
         self.add_exec_out("exec")
 
+    def draw_buttons(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, "pinned", toggle=True)
+        row.prop(self, "ttl")
+        row = layout.row(align=True)
+        row.prop(self, "use_disk", toggle=True)
+        if self.use_disk:
+            row.prop(self, "version", text="")
+
     def execute(self):
         in_name = self.get_input_value("name")
         in_value = self.get_input_value("value")
-        add_cache(in_name, in_value)
+        add_cache(in_name, in_value, self.pinned, self.ttl, self.use_disk, self.version)
         self.execute_next("exec")
 
 
@@ -34,13 +53,22 @@ class EGN_GetCache(EG_PureNode):
     bl_label = "Get Cache"
     bl_icon = "PACKAGE"
 
+    use_disk: BoolProperty(name="Disk", description="Load the value saved next to the blend file when it is not in memory", default=False, update=update_node) # type: ignore
+    version: StringProperty(name="Version", description="Only load files saved with this key", update=update_node) # type: ignore
+
     def init(self, context):
         self.add_in("NodeSocketString", "name", 1, False)
         self.add_out(EGS_Value.bl_idname, "value")
 
+    def draw_buttons(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, "use_disk", toggle=True)
+        if self.use_disk:
+            row.prop(self, "version", text="")
+
     def on_value(self):
         in_name = self.get_input_value("name")
-        return get_cache(in_name)
+        return get_cache(in_name, self.use_disk, self.version)
 
 
 class EGN_RemoveCache(EG_Node):
@@ -50,6 +78,8 @@ class EGN_RemoveCache(EG_Node):
     bl_label = "Remove Cache"
     bl_icon = "PACKAGE"
 
+    replay = False
+
     name: StringProperty(name="Name") # type: ignore
 
     def init(self, context):
@@ -71,6 +101,8 @@ class EGN_FlushCache(EG_Node):
     bl_label = "Flush Cache"
     bl_icon = "PACKAGE"
 
+    replay = False
+
     def init(self, context):
         self.add_exec_in("exec")
         self.add_exec_out("exec")
@@ -87,12 +119,33 @@ class EGN_DumpCache(EG_Node):
     bl_label = "Dump Cache"
     bl_icon = "PACKAGE"
 
+    replay = False
+
+    mode: EnumProperty(
+        name="Mode",
+        items=[
+            ("SUMMARY", "Summary", "Print hits, misses, evictions and sizes of the largest entries"),
+            ("VALUES", "Values", "Print every stored value"),
+        ],
+        default="SUMMARY"
+    ) # type: ignore
+
+    limit: IntProperty(name="Top", description="Entries listed in the summary", default=10, min=1) # type: ignore
+
     def init(self, context):
         self.add_exec_in("exec")
         self.add_exec_out("exec")
 
+    def draw_buttons(self, context, layout):
+        layout.prop(self, "mode")
+        if self.mode == "SUMMARY":
+            layout.prop(self, "limit")
+
     def execute(self):
-        print(cache_map)
+        if self.mode == "SUMMARY":
+            print(describe_cache(cache_store, active_frame(), self.limit))
+        else:
+            print(dict(cache_store.items()))
         self.execute_next("exec")
 
 
@@ -13,6 +13,8 @@ class PNY_ToFloat(EG_PureNode):
     bl_label = "To Float"
     bl_icon = "CENTER_ONLY"
 
+    memoize = True
+
     def init(self, context):
         self.add_in(EGS_Value.bl_idname, "value")
         self.add_out("NodeSocketFloat", "float") # bind: float -> on_float
@@ -28,6 +30,8 @@ class PNY_ToInteger(EG_PureNode):
     bl_label = "To Integer"
     bl_icon = "CENTER_ONLY"
 
+    memoize = True
+
     def init(self, context):
         self.add_in(EGS_Value.bl_idname, "value")
         self.add_out("NodeSocketInt", "int") # bind: int -> on_int
@@ -43,6 +47,8 @@ class PNY_ToString(EG_PureNode):
     bl_label = "To String"
     bl_icon = "CENTER_ONLY"
 
+    memoize = True
+
     def init(self, context):
         self.add_in(EGS_Value.bl_idname, "value")
         self.add_out("NodeSocketString", "string") # bind: string -> on_string
@@ -58,6 +64,8 @@ class PNY_ArrayToSet(EG_PureNode):
     bl_label = "Array To Set"
     bl_icon = "CENTER_ONLY"
 
+    memoize = True
+
     def init(self, context):
         self.add_in(EGS_Array.bl_idname, "array")
         self.add_out(EGS_Set.bl_idname, "set") # bind: set -> on_set
@@ -74,6 +82,8 @@ class PNY_SetToArray(EG_PureNode):
     bl_label = "Set To Array"
     bl_icon = "CENTER_ONLY"
 
+    memoize = True
+
     def init(self, context):
         self.add_in(EGS_Set.bl_idname, "set")
         self.add_out(EGS_Array.bl_idname, "array") # bind: array -> on_array
@@ -3,12 +3,14 @@ import bpy
 from bpy.props import ( BoolProperty, FloatProperty, EnumProperty, StringProperty, IntProperty, PointerProperty, CollectionProperty, FloatVectorProperty )
 
 from ...base.node import EG_Node
-from ...base.library import add_linked_cache, get_linked_cache, remove_linked_cache
+from ...base.library import add_linked_cache, get_linked_cache, remove_linked_cache, get_preference
+from ...base.frame import current_frame
 
 from ...socket.user import EGS_Object
 from ...socket.primitive import EGS_Value
 from ...socket.derived import EGS_Array
 from ...operator.exec_main import EGOP_ExecuteMain
+from ...operator.exec_stop import EGOP_StopExecution
 
 
 class EGN_Function(EG_Node):
@@ -23,12 +25,37 @@ class EGN_Function(EG_Node):
         self.add_out(EGS_Object.bl_idname, "args")
 
     def draw_buttons(self, context, layout):
-        layout.operator(EGOP_ExecuteMain.bl_idname, text="Execute")
+        row = layout.row(align=True)
+        row.operator(EGOP_ExecuteMain.bl_idname, text="Execute")
+        row.operator(EGOP_StopExecution.bl_idname, text="Stop")
+
+    def on_args(self):
+        return get_linked_cache(self, "args")
 
     def execute(self):
         self.execute_next("exec")
 
 
+class EGN_Output(EG_Node):
+    """Set the result of the run"""
+
+    bl_idname = "egn_python_output"
+    bl_label = "Output"
+    bl_icon = "EXPORT"
+
+    # Result belongs to the frame of each run
+    replay = False
+
+    def init(self, context):
+        self.add_exec_in("exec")
+        self.add_in(EGS_Value.bl_idname, "value")
+        self.add_exec_out("exec")
+
+    def execute(self):
+        current_frame().result = self.get_input_value("value")
+        self.execute_next("exec")
+
+
 class EGN_Callback(EG_Node):
     """A Callback Node"""
     
@@ -97,6 +124,8 @@ class EGN_FlipFlop(EG_Node):
     bl_idname = "egn_python_flipflop"
     bl_label = "Flip Flop"
 
+    replay = False
+
     active_state: BoolProperty(name="State", default=True) # type: ignore
     
     def init(self, context):
@@ -104,12 +133,26 @@ class EGN_FlipFlop(EG_Node):
         self.add_exec_out("a")
         self.add_exec_out("b")
 
+    def write_state(self, state):
+        if self.active_state != state:
+            self.active_state = state
+
     def execute(self):
-        if self.active_state:
-            self.active_state = False
+        frame = current_frame()
+        values = frame.get_values(self)
+
+        # Read property once per run and keep toggling
+        # in memory, it is written back when the run ends
+        state = values.get("state")
+        if state is None:
+            state = self.active_state
+
+        values["state"] = not state
+        frame.defer(self, "state", lambda: self.write_state(not state))
+
+        if state:
             self.execute_next("a")
         else:
-            self.active_state = True
             self.execute_next("b")
 
 
@@ -132,16 +175,26 @@ class EGN_ForLoop(EG_Node):
         self.add_exec_out("completed")
 
     def on_index(self):
-        return self.prop_index
+        return get_linked_cache(self, "index")
 
     def execute(self):
         in_start = self.get_input_value("start")
         in_end = self.get_input_value("end")
-        self.prop_index = in_start
 
+        frame = current_frame()
+        values = frame.get_values(self)
+        values["index"] = in_start
+
+        # Resume after each iteration flow has finished
         for index in range(in_start, in_end):
-            self.prop_index = index
+            values["index"] = index
             self.execute_next("loop")
+            yield
+
+        # Show last index on the node only while debugging
+        if get_preference().debug_mode:
+            last = values["index"]
+            frame.defer(self, "index", lambda: setattr(self, "prop_index", last))
 
         self.execute_next("completed")
 
@@ -170,9 +223,11 @@ class EGN_ForEach(EG_Node):
 
         in_list = self.get_input_value("list")
 
+        # Resume after each iteration flow has finished
         for item in in_list:
             add_linked_cache(self, "item", item)
             self.execute_next("loop")
+            yield
 
         remove_linked_cache(self, "item")
         self.execute_next("completed")
@@ -183,6 +238,7 @@ class EGN_ForEach(EG_Node):
 
 classes = [
     EGN_Function,
+    EGN_Output,
     EGN_Callback,
     EGN_Branch,
     EGN_Sequence,
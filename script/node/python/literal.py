@@ -1,7 +1,7 @@
 import bpy
 from bpy.props import ( BoolProperty, FloatProperty, EnumProperty, StringProperty, IntProperty, PointerProperty, CollectionProperty, FloatVectorProperty )
 
-from ...base.node import EG_PureNode
+from ...base.node import EG_PureNode, update_node
 from ...base.library import create_enum
 
 from ...socket.derived import EGS_Vector2D, EGS_Vector4D
@@ -13,7 +13,9 @@ class EGN_LiteralInteger(EG_PureNode):
     bl_idname = "egn_python_literal_integer"
     bl_label = "Literal Integer"
 
-    value: IntProperty(name="Value") # type: ignore
+    memoize = True
+
+    value: IntProperty(name="Value", update=update_node) # type: ignore
 
     def init(self, context):
         self.add_out("NodeSocketInt", "value")
@@ -31,7 +33,9 @@ class EGN_LiteralFloat(EG_PureNode):
     bl_idname = "egn_python_literal_float"
     bl_label = "Literal Float"
 
-    value: FloatProperty(name="Value") # type: ignore
+    memoize = True
+
+    value: FloatProperty(name="Value", update=update_node) # type: ignore
 
     def init(self, context):
         self.add_out("NodeSocketFloat", "value")
@@ -49,13 +53,16 @@ class EGN_LiteralColor(EG_PureNode):
     bl_idname = "egn_python_literal_color"
     bl_label = "Literal Color"
 
+    memoize = True
+
     value: FloatVectorProperty(
         name="Value",
         min=0.0,
         max=1.0,
         default=(1.0, 1.0, 1.0, 1.0),
         subtype="COLOR",
-        size=4
+        size=4,
+        update=update_node
     ) # type: ignore
 
     def init(self, context):
@@ -74,7 +81,9 @@ class EGN_LiteralString(EG_PureNode):
     bl_idname = "egn_python_literal_string"
     bl_label = "Literal String"
 
-    value: StringProperty(name="Value") # type: ignore
+    memoize = True
+
+    value: StringProperty(name="Value", update=update_node) # type: ignore
 
     def init(self, context):
         self.add_out("NodeSocketString", "value")
@@ -92,7 +101,9 @@ class EGN_LiteralBoolean(EG_PureNode):
     bl_idname = "egn_python_literal_boolean"
     bl_label = "Literal Boolean"
 
-    value: BoolProperty(name="Value") # type: ignore
+    memoize = True
+
+    value: BoolProperty(name="Value", update=update_node) # type: ignore
 
     def init(self, context):
         self.add_out("NodeSocketBool", "value")
@@ -110,6 +121,8 @@ class PNY_Break2D(EG_PureNode):
     bl_idname = "egn_python_break_2d"
     bl_label = "Break 2D Vector"
 
+    memoize = True
+
     def init(self, context):
         self.add_in(EGS_Vector2D.bl_idname, "vector")
         self.add_out("NodeSocketFloat", "x") # bind: x -> on_x
@@ -128,6 +141,8 @@ class PNY_Break3D(EG_PureNode):
     bl_idname = "egn_python_break_3d"
     bl_label = "Break 3D Vector"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketVector", "vector")
         self.add_out("NodeSocketFloat", "x") # bind: x -> on_x
@@ -150,6 +165,8 @@ class PNY_Break4D(EG_PureNode):
     bl_idname = "egn_python_break_4d"
     bl_label = "Break 4D Vector"
 
+    memoize = True
+
     def init(self, context):
         self.add_in(EGS_Vector4D.bl_idname, "vector")
         self.add_out("NodeSocketFloat", "x") # bind: x -> on_x
@@ -176,6 +193,8 @@ class PNY_Make2D(EG_PureNode):
     bl_idname = "egn_python_make_2d"
     bl_label = "Make 2D Vector"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketFloat", "x", 1, False)
         self.add_in("NodeSocketFloat", "y", 1, False)
@@ -193,6 +212,8 @@ class PNY_Make3D(EG_PureNode):
     bl_idname = "egn_python_make_3d"
     bl_label = "Make 3D Vector"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketFloat", "x", 1, False)
         self.add_in("NodeSocketFloat", "y", 1, False)
@@ -212,6 +233,8 @@ class PNY_Make4D(EG_PureNode):
     bl_idname = "egn_python_make_4d"
     bl_label = "Make 4D Vector"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketFloat", "x", 1, False)
         self.add_in("NodeSocketFloat", "y", 1, False)
@@ -14,6 +14,8 @@ class EGN_MakeMap(EG_PureNode):
     bl_label = "Make Map"
     bl_icon = "PRESET"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "key", 1, False)
         self.add_in(EGS_Value.bl_idname, "value")
@@ -32,6 +34,8 @@ class EGN_MapMerge(EG_PureNode):
     bl_label = "Merge"
     bl_icon = "PRESET"
 
+    memoize = True
+
     def init(self, context):
         self.add_in(EGS_Map.bl_idname, "maps", 100)
         self.add_out(EGS_Map.bl_idname, "map") # bind: map -> on_map
@@ -110,6 +114,8 @@ class EGN_MapKeys(EG_PureNode):
     bl_label = "Keys"
     bl_icon = "PRESET"
 
+    memoize = True
+
     def init(self, context):
         self.add_in(EGS_Map.bl_idname, "map")
         self.add_out(EGS_Array.bl_idname, "keys") # bind: keys -> on_keys
@@ -126,6 +132,8 @@ class EGN_MapValues(EG_PureNode):
     bl_label = "Values"
     bl_icon = "PRESET"
 
+    memoize = True
+
     def init(self, context):
         self.add_in(EGS_Map.bl_idname, "map")
         self.add_out(EGS_Array.bl_idname, "values") # bind: values -> on_values
@@ -142,6 +150,8 @@ class EGN_MapItems(EG_PureNode):
     bl_label = "Items"
     bl_icon = "PRESET"
 
+    memoize = True
+
     def init(self, context):
         self.add_in(EGS_Map.bl_idname, "map")
         self.add_out(EGS_Array.bl_idname, "items") # bind: items -> on_items
@@ -2,7 +2,7 @@ import uuid
 import bpy
 from bpy.props import ( BoolProperty, FloatProperty, EnumProperty, StringProperty, IntProperty, PointerProperty, CollectionProperty, FloatVectorProperty )
 
-from ...base.node import EG_PureNode
+from ...base.node import EG_PureNode, update_node
 from ...base.library import create_enum
 from ...socket.primitive import EGS_Value
 
@@ -13,10 +13,13 @@ class EGN_ArithmeticOperator(EG_PureNode):
     bl_idname = "egn_python_arithmetic_operator"
     bl_label = "Arithmetic Operator"
 
+    memoize = True
+
     operator: EnumProperty(
         name="Operator",
         items=create_enum(["+", "-", "*", "/"]),
-        default="+"
+        default="+",
+        update=update_node
     ) # type: ignore
 
     def draw_buttons(self, context, layout):
@@ -53,10 +56,13 @@ class EGN_CompareOperator(EG_PureNode):
     bl_idname = "egn_python_compare_operator"
     bl_label = "Compare Operator"
 
+    memoize = True
+
     operator: EnumProperty(
         name="Operator",
         items=create_enum(["<", ">", "<=", ">=", "==", "!="]),
-        default="<"
+        default="<",
+        update=update_node
     ) # type: ignore
 
     def draw_buttons(self, context, layout):
@@ -99,6 +105,8 @@ class EGN_LogicalAndOperator(EG_PureNode):
     bl_idname = "egn_python_logical_and_operator"
     bl_label = "And"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketBool", "a")
         self.add_in("NodeSocketBool", "b")
@@ -117,6 +125,8 @@ class EGN_LogicalOrOperator(EG_PureNode):
     bl_idname = "egn_python_logical_or_operator"
     bl_label = "Or"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketBool", "a")
         self.add_in("NodeSocketBool", "b")
@@ -135,6 +145,8 @@ class EGN_LogicalNotOperator(EG_PureNode):
     bl_idname = "egn_python_logical_not_operator"
     bl_label = "Not"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketBool", "a")
         self.add_out("NodeSocketBool", "result") # bind: result -> on_result
@@ -150,10 +162,13 @@ class EGN_IdentityOperator(EG_PureNode):
     bl_idname = "egn_python_identity_operator"
     bl_label = "Identity Comparison"
 
+    memoize = True
+
     operator: EnumProperty(
         name="Operator",
         items=create_enum(["is", "is not"]),
-        default="is"
+        default="is",
+        update=update_node
     ) # type: ignore
 
     def init(self, context):
@@ -183,10 +198,13 @@ class EGN_MembershipOperator(EG_PureNode):
     bl_idname = "egn_python_membership_operator"
     bl_label = "Membership Check"
 
+    memoize = True
+
     operator: EnumProperty(
         name="Operator",
         items=create_enum(["in", "not in"]),
-        default="in"
+        default="in",
+        update=update_node
     ) # type: ignore
 
     def init(self, context):
@@ -216,6 +234,8 @@ class EGN_IsOfClass(EG_PureNode):
     bl_idname = "egn_python_is_of_class"
     bl_label = "Is Of Class"
 
+    memoize = True
+
     prop_type: EnumProperty(
         name="Type",
         items=[
@@ -227,7 +247,8 @@ class EGN_IsOfClass(EG_PureNode):
             ("TUPLE", "Tuple", ""),
             ("MAP", "Map", ""),
             ("NONE", "None", ""),
-        ]
+        ],
+        update=update_node
     ) # type: ignore
 
     def init(self, context):
@@ -15,6 +15,8 @@ class EGN_MakeSet(EG_PureNode):
     bl_idname = "egn_python_make_set"
     bl_label = "Make Set"
 
+    memoize = True
+
     def init(self, context):
         self.add_in(EGS_Value.bl_idname, "item", 100)
         self.add_out(EGS_Set.bl_idname, "set") # bind: set -> on_set
@@ -63,6 +65,8 @@ class EGN_SetDifference(EG_PureNode):
     
     bl_idname = "egn_python_set_difference"
     bl_label = "Difference"
+
+    memoize = True
     
     def init(self, context):
         self.add_in(EGS_Set.bl_idname, "a")
@@ -98,6 +102,8 @@ class EGN_SetIntersection(EG_PureNode):
     
     bl_idname = "egn_python_set_intersection"
     bl_label = "Intersection"
+
+    memoize = True
     
     def init(self, context):
         self.add_in(EGS_Set.bl_idname, "a")
@@ -115,6 +121,8 @@ class EGN_SetIsDisjoint(EG_PureNode):
     
     bl_idname = "egn_python_set_is_disjoint"
     bl_label = "Is Disjoint"
+
+    memoize = True
     
     def init(self, context):
         self.add_in(EGS_Set.bl_idname, "a")
@@ -132,6 +140,8 @@ class EGN_SetIsSubset(EG_PureNode):
     
     bl_idname = "egn_python_set_is_subset"
     bl_label = "Is Subset"
+
+    memoize = True
     
     def init(self, context):
         self.add_in(EGS_Set.bl_idname, "a")
@@ -149,6 +159,8 @@ class EGN_SetIsSuperSet(EG_PureNode):
     
     bl_idname = "egn_python_set_is_superset"
     bl_label = "Is Superset"
+
+    memoize = True
     
     def init(self, context):
         self.add_in(EGS_Set.bl_idname, "a")
@@ -182,6 +194,8 @@ class EGN_SetSymmetricDifference(EG_PureNode):
     
     bl_idname = "egn_python_set_symmetric_difference"
     bl_label = "Symmetric Difference"
+
+    memoize = True
     
     def init(self, context):
         self.add_in(EGS_Set.bl_idname, "a")
@@ -199,6 +213,8 @@ class EGN_SetUnion(EG_PureNode):
     
     bl_idname = "egn_python_set_union"
     bl_label = "Union"
+
+    memoize = True
     
     def init(self, context):
         self.add_in(EGS_Set.bl_idname, "a")
@@ -216,6 +232,8 @@ class EGN_SetLength(EG_PureNode):
     
     bl_idname = "egn_python_set_length"
     bl_label = "Length"
+
+    memoize = True
     
     def init(self, context):
         self.add_in(EGS_Set.bl_idname, "set")
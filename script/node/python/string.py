@@ -1,7 +1,7 @@
 import bpy
 from bpy.props import ( BoolProperty, FloatProperty, EnumProperty, StringProperty, IntProperty, PointerProperty, CollectionProperty )
 
-from ...base.node import EG_Node, EG_PureNode
+from ...base.node import EG_Node, EG_PureNode, update_node
 from ...base.library import create_enum
 
 from ...socket.derived import EGS_Array
@@ -15,6 +15,8 @@ class EGN_AppendString(EG_PureNode):
     bl_label = "Append"
     bl_icon = "FONTPREVIEW"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "a", 1, False)
         self.add_in("NodeSocketString", "b", 1, False)
@@ -31,6 +33,8 @@ class EGN_ContainString(EG_PureNode):
     bl_label = "Contains"
     bl_icon = "FONTPREVIEW"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "source", 1, False)
         self.add_in("NodeSocketString", "match", 1, False)
@@ -49,6 +53,8 @@ class EGN_SliceString(EG_PureNode):
     bl_label = "Slice"
     bl_icon = "FONTPREVIEW"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "source", 1, False)
         self.add_in("NodeSocketInt", "start", 1, False)
@@ -69,6 +75,8 @@ class EGN_SliceFromStartString(EG_PureNode):
     bl_label = "Slice From Start"
     bl_icon = "FONTPREVIEW"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "source", 1, False)
         self.add_in("NodeSocketInt", "start", 1, False)
@@ -87,6 +95,8 @@ class EGN_SliceFromEndString(EG_PureNode):
     bl_label = "Slice From End"
     bl_icon = "FONTPREVIEW"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "source", 1, False)
         self.add_in("NodeSocketInt", "end", 1, False)
@@ -105,6 +115,8 @@ class EGN_ToUpperString(EG_PureNode):
     bl_label = "To Upper"
     bl_icon = "FONTPREVIEW"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "source", 1, False)
         self.add_out("NodeSocketString", "result") # bind: result -> on_result
@@ -121,6 +133,8 @@ class EGN_ToLowerString(EG_PureNode):
     bl_label = "To Lower"
     bl_icon = "FONTPREVIEW"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "source", 1, False)
         self.add_out("NodeSocketString", "result") # bind: result -> on_result
@@ -137,6 +151,8 @@ class EGN_CapitalizeString(EG_PureNode):
     bl_label = "Capitalize"
     bl_icon = "FONTPREVIEW"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "source", 1, False)
         self.add_out("NodeSocketString", "result") # bind: result -> on_result
@@ -153,6 +169,8 @@ class EGN_CasefoldString(EG_PureNode):
     bl_label = "Casefold"
     bl_icon = "FONTPREVIEW"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "source", 1, False)
         self.add_out("NodeSocketString", "result") # bind: result -> on_result
@@ -169,6 +187,8 @@ class EGN_CountString(EG_PureNode):
     bl_label = "Count"
     bl_icon = "FONTPREVIEW"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "source", 1, False)
         self.add_in("NodeSocketString", "match", 1, False)
@@ -187,6 +207,8 @@ class EGN_EndsWithString(EG_PureNode):
     bl_label = "Ends With"
     bl_icon = "FONTPREVIEW"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "source", 1, False)
         self.add_in("NodeSocketString", "match", 1, False)
@@ -205,6 +227,8 @@ class EGN_FindString(EG_PureNode):
     bl_label = "Find"
     bl_icon = "FONTPREVIEW"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "source", 1, False)
         self.add_in("NodeSocketString", "match", 1, False)
@@ -223,6 +247,8 @@ class EGN_IndexString(EG_PureNode):
     bl_label = "Index Of"
     bl_icon = "FONTPREVIEW"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "source", 1, False)
         self.add_in("NodeSocketString", "match", 1, False)
@@ -241,10 +267,13 @@ class EGN_IsAString(EG_PureNode):
     bl_label = "Is A"
     bl_icon = "FONTPREVIEW"
 
+    memoize = True
+
     condition: EnumProperty(
         name="Operator",
         items=create_enum(["alnum", "alpha", "ascii", "decimal", "digit", "lower", "numeric", "space", "title", "upper"]),
-        default="alnum"
+        default="alnum",
+        update=update_node
     ) # type: ignore
 
     def init(self, context):
@@ -289,6 +318,8 @@ class EGN_StripString(EG_PureNode):
     bl_label = "Strip"
     bl_icon = "FONTPREVIEW"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "source", 1, False)
         self.add_out("NodeSocketString", "result") # bind: result -> on_result
@@ -305,6 +336,8 @@ class EGN_SplitString(EG_PureNode):
     bl_label = "Split"
     bl_icon = "FONTPREVIEW"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "source", 1, False)
         self.add_in("NodeSocketString", "separator", 1, False)
@@ -323,6 +356,8 @@ class EGN_ReplaceString(EG_PureNode):
     bl_label = "Replace"
     bl_icon = "FONTPREVIEW"
 
+    memoize = True
+
     def init(self, context):
         self.add_in("NodeSocketString", "source", 1, False)
         self.add_in("NodeSocketString", "match", 1, False)
@@ -4,7 +4,7 @@ import time
 import bpy
 from bpy.props import ( BoolProperty, FloatProperty, EnumProperty, StringProperty, IntProperty, PointerProperty, CollectionProperty, FloatVectorProperty )
 
-from ...base.node import EG_Node, EG_PureNode
+from ...base.node import EG_Node, EG_PureNode, update_node, active_flow
 from ...base.library import create_enum
 from ...socket.primitive import EGS_Value
 
@@ -15,6 +15,8 @@ class EGN_Print(EG_Node):
     bl_idname = "egn_python_print"
     bl_label = "Print"
 
+    replay = False
+
     def init(self, context):
         self.add_exec_in("exec")
         self.add_in(EGS_Value.bl_idname, "value")
@@ -32,6 +34,8 @@ class EGN_SyncDelay(EG_Node):
     bl_label = "Sync Delay"
     bl_icon = "PREVIEW_RANGE"
 
+    replay = False
+
     def init(self, context):
         self.add_exec_in("exec")
         self.add_in("NodeSocketFloat", "time", 1, False)
@@ -46,7 +50,14 @@ class EGN_SyncDelay(EG_Node):
             print("Minimum time is 0.1 seconds")
             return
         
-        time.sleep(in_time)
+        # Let the running flow wait, so a timed
+        # run doesn't block the interface
+        flow = active_flow()
+        if flow:
+            flow.wait(in_time)
+        else:
+            time.sleep(in_time)
+
         self.execute_next("exec")
 
 
@@ -71,8 +82,10 @@ class EGN_AsyncDelay(EG_Node):
             print("Minimum time is 0.1 seconds")
             return
 
+        resume = self.resume_later("exec")
+
         def delayed_execution():
-            self.execute_next("exec")
+            resume()
             return None
 
         bpy.app.timers.register(delayed_execution, first_interval=in_time)
@@ -84,6 +97,8 @@ class EGN_Math(EG_PureNode):
     bl_idname = "egn_python_math"
     bl_label = "Math"
 
+    memoize = True
+
     single_in = {
         "acos", "acosh", "asin", "asinh", "atan", "atanh", "ceil", "cos",
         "cosh", "degrees", "erf", "erfc", "exp", "expm1", "fabs",
@@ -112,6 +127,8 @@ class EGN_Math(EG_PureNode):
             if "b" in self.inputs:
                 self.rem_in("b")
 
+        update_node(self, context)
+
     methods: EnumProperty(
         name="Method",
         items=[(op, op, "") for op in single_in | double_in | integer_single_in | integer_double_in],
@@ -0,0 +1,16 @@
+import bpy
+
+from ..base.cache import cache_store
+
+
+class EGOP_CacheStatsReset(bpy.types.Operator):
+    """Clear cache hit, miss and eviction counters"""
+    bl_idname = "egop.cache_stats_reset"
+    bl_label = "Reset Cache Statistics"
+
+    def execute(self, context):
+        cache_store.reset_stats()
+        return {"FINISHED"}
+
+
+classes = [ EGOP_CacheStatsReset ]
@@ -0,0 +1,83 @@
+import json
+import time
+import bpy
+from bpy.props import ( StringProperty )
+
+from ..base.library import flush_cache, get_preference
+from ..base.compiler import get_plan
+from ..base.frame import EG_ExecutionFrame
+from ..base.node import execute_plan
+from ..base.tracer import tracer
+
+
+class EGOP_ExecuteHeadless(bpy.types.Operator):
+    """Execute a function node by name, for running graphs from the command line"""
+    bl_idname = "egop.execute_headless"
+    bl_label = "Execute Headless"
+
+    tree: StringProperty(name="Tree", description="Name of the event graph") # type: ignore
+    node: StringProperty(name="Node", description="Name of the function node", default="Function") # type: ignore
+    args: StringProperty(name="Args", description="JSON value passed to the args output of the function", default="null") # type: ignore
+    output: StringProperty(name="Output", description="Optional file the result is written to as JSON", subtype="FILE_PATH") # type: ignore
+
+    def write_result(self, report):
+
+        # Single line so shell scripts can grep it
+        # out of everything else blender prints
+        line = json.dumps(report, default=str)
+        print(f"EG_RESULT {line}")
+
+        if self.output:
+            with open(bpy.path.abspath(self.output), "w") as file:
+                file.write(line)
+
+    def execute(self, context):
+        report = { "tree": self.tree, "node": self.node, "status": "failed" }
+
+        tree = bpy.data.node_groups.get(self.tree)
+        node = tree.nodes.get(self.node) if tree and tree.bl_idname == "eg_nodetree" else None
+
+        if not node or node.bl_idname != "egn_python_function":
+            report["error"] = "Function node not found"
+            self.write_result(report)
+            return {"CANCELLED"}
+
+        try:
+            args = json.loads(self.args) if self.args else None
+        except ValueError as e:
+            report["error"] = f"Invalid args: {e}"
+            self.write_result(report)
+            return {"CANCELLED"}
+
+        # clear the old variables before executing, values
+        # kept by scene reading nodes stay until the scene changes
+        flush_cache("user")
+
+        preference = get_preference()
+        plan = get_plan(node, preference.memoize_pure, preference.profile_nodes, preference.trace_runs, preference.persist_pure)
+        if preference.trace_runs:
+            tracer.start(bpy.path.abspath(preference.trace_path))
+
+        # Always blocking, timers don't run once the
+        # expression returned, so continuations never do
+        frame = EG_ExecutionFrame(plan)
+        start = time.perf_counter()
+        result = execute_plan(plan, args, frame)
+
+        report["seconds"] = time.perf_counter() - start
+        report["result"] = result
+        report["errors"] = frame.errors
+
+        if frame.cancelled:
+            report["status"] = "cancelled"
+        elif frame.pending:
+            report["status"] = "pending"
+            report["error"] = f"{frame.pending} continuations never ran"
+        elif not frame.errors:
+            report["status"] = "finished"
+
+        self.write_result(report)
+        return {"FINISHED"} if report["status"] == "finished" else {"CANCELLED"}
+
+
+classes = [ EGOP_ExecuteHeadless ]
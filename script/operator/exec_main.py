@@ -2,28 +2,80 @@ import bpy
 from bpy.props import ( BoolProperty, FloatProperty, EnumProperty, StringProperty, IntProperty, PointerProperty, CollectionProperty )
 from bpy_extras.io_utils import ImportHelper
 
-from ..base.library import flush_cache
+from ..base.library import flush_cache, get_preference
+from ..base.compiler import get_plan
+from ..base.node import execute_plan
+from ..base.frame import EG_ExecutionFrame
+from ..base.incremental import begin_incremental
+from ..base.scheduler import EG_TimedRun
+from ..base.profiler import profiler
+from ..base.tracer import tracer
 
 class EGOP_ExecuteMain(bpy.types.Operator):
     """Execute Main Operator"""
     bl_idname = "egop.execute_main"
     bl_label = "Execute Main"
 
-    def execute(self, context):
+    def start(self, context):
         node = context.active_node
         if node and node.bl_idname == "egn_python_function":
 
-            # clear the old variables before executing
-            # to prevent duplication
-            flush_cache()
-            result = node.execute()
-            
-            self.report({"INFO"}, f"Output Node Result: {result}")
+            # clear the old variables before executing, values
+            # kept by scene reading nodes stay until the scene changes
+            flush_cache("user")
+
+            # compile once and reuse until the tree changes
+            preference = get_preference()
+            plan = get_plan(node, preference.memoize_pure, preference.profile_nodes, preference.trace_runs, preference.persist_pure)
+
+            # timings shown are of the last run only
+            profiler.reset()
+            if preference.trace_runs:
+                tracer.start(bpy.path.abspath(preference.trace_path))
+
+            frame = EG_ExecutionFrame(plan)
+            if preference.incremental_runs:
+                begin_incremental(frame)
+
+            if preference.execution_mode == "TIMED":
+                run = EG_TimedRun(plan, preference.time_budget, frame)
+                run.start()
+                self.report({"INFO"}, "Execution started")
+                return run
+
+            else:
+                result = execute_plan(plan, frame=frame)
+                self.report({"INFO"}, f"Output Node Result: {result}")
             
         else:
             self.report({"WARNING"}, "Active node is not an define node")
 
+        return None
+
+    def execute(self, context):
+        self.start(context)
         return {"FINISHED"}
 
+    def invoke(self, context, event):
+        self.run = self.start(context)
+        if self.run is None:
+            return {"FINISHED"}
+
+        # Keep listening while a timed run is
+        # going so it can be stopped with Esc
+        context.window_manager.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        if self.run.finished:
+            return {"FINISHED"}
+
+        if event.type == "ESC":
+            self.run.cancel()
+            self.report({"WARNING"}, "Execution cancelled")
+            return {"CANCELLED"}
+
+        return {"PASS_THROUGH"}
+
 
 classes = [ EGOP_ExecuteMain ]
\ No newline at end of file
@@ -0,0 +1,23 @@
+import bpy
+
+from ..base.frame import cancel_frames
+
+
+class EGOP_StopExecution(bpy.types.Operator):
+    """Stop running executions of the active function"""
+    bl_idname = "egop.stop_execution"
+    bl_label = "Stop Execution"
+
+    def execute(self, context):
+        node = context.active_node
+        if node and node.bl_idname == "egn_python_function":
+            cancel_frames(root=node)
+            self.report({"INFO"}, "Execution stopped")
+
+        else:
+            self.report({"WARNING"}, "Active node is not an define node")
+
+        return {"FINISHED"}
+
+
+classes = [ EGOP_StopExecution ]
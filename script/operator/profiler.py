@@ -0,0 +1,37 @@
+import bpy
+
+from ..base.profiler import profiler
+
+
+class EGOP_ProfilerReset(bpy.types.Operator):
+    """Clear recorded node timings"""
+    bl_idname = "egop.profiler_reset"
+    bl_label = "Reset Profiler"
+
+    def execute(self, context):
+        profiler.reset()
+        return {"FINISHED"}
+
+
+class EGOP_ProfilerExport(bpy.types.Operator):
+    """Write recorded node timings into a text block"""
+    bl_idname = "egop.profiler_export"
+    bl_label = "Export Profile"
+
+    def execute(self, context):
+        rows = profiler.rows()
+        if not rows:
+            self.report({"WARNING"}, "No profile recorded")
+            return {"CANCELLED"}
+
+        text = bpy.data.texts.get("EG Profile") or bpy.data.texts.new("EG Profile")
+        text.clear()
+        text.write("tree,node,calls,total_ms,self_ms\n")
+        for node, stats in rows:
+            text.write(f"{node.id_data.name},{node.name},{stats.calls},{stats.total * 1000:.4f},{stats.own * 1000:.4f}\n")
+
+        self.report({"INFO"}, f"Profile written to {text.name}")
+        return {"FINISHED"}
+
+
+classes = [ EGOP_ProfilerReset, EGOP_ProfilerExport ]
@@ -0,0 +1,54 @@
+import bpy
+
+from ..base.cache import cache_store, format_size
+from ..operator.cache import EGOP_CacheStatsReset
+
+
+class EGPT_Cache(bpy.types.Panel):
+    """Usage and size of the runtime cache"""
+    bl_idname = "EG_PT_cache"
+    bl_label = "Cache"
+    bl_space_type = "NODE_EDITOR"
+    bl_region_type = "UI"
+    bl_category = "Event Graph"
+
+    row_limit = 10
+
+    @classmethod
+    def poll(cls, context):
+        space = context.space_data
+        return space and space.tree_type == "eg_nodetree"
+
+    def draw(self, context):
+        layout = self.layout
+        layout.label(text=f"{len(cache_store)} entries, {format_size(cache_store.size)} of {format_size(cache_store.max_bytes)}")
+        layout.operator(EGOP_CacheStatsReset.bl_idname, text="Reset Statistics")
+
+        namespaces, keys, elapsed = cache_store.summary()
+        if not keys:
+            return
+
+        grid = layout.grid_flow(columns=5, even_columns=False, align=True)
+        for text in ("Key", "Size", "Hits", "Misses", "Evicted"):
+            grid.label(text=text)
+
+        for namespace, stats in sorted(namespaces.items()):
+            grid.label(text=f"[{namespace}]")
+            grid.label(text=format_size(stats.size))
+            grid.label(text=str(stats.hits))
+            grid.label(text=str(stats.misses))
+            grid.label(text=str(stats.evictions))
+
+        keys.sort(key=lambda row: row[1].size, reverse=True)
+        for (namespace, name), stats in keys[:self.row_limit]:
+            grid.label(text=str(name))
+            grid.label(text=format_size(stats.size))
+            grid.label(text=str(stats.hits))
+            grid.label(text=str(stats.misses))
+            grid.label(text=str(stats.evictions))
+
+        total = sum(stats.inserts for stats in namespaces.values())
+        layout.label(text=f"Inserts: {total / elapsed:.1f}/s")
+
+
+classes = [ EGPT_Cache ]
@@ -0,0 +1,46 @@
+import bpy
+
+from ..base.profiler import profiler
+from ..operator.profiler import EGOP_ProfilerReset, EGOP_ProfilerExport
+
+
+class EGPT_Profiler(bpy.types.Panel):
+    """Node timings of the last profiled run"""
+    bl_idname = "EG_PT_profiler"
+    bl_label = "Profiler"
+    bl_space_type = "NODE_EDITOR"
+    bl_region_type = "UI"
+    bl_category = "Event Graph"
+
+    row_limit = 20
+
+    @classmethod
+    def poll(cls, context):
+        space = context.space_data
+        return space and space.tree_type == "eg_nodetree"
+
+    def draw(self, context):
+        layout = self.layout
+
+        row = layout.row(align=True)
+        row.operator(EGOP_ProfilerReset.bl_idname, text="Reset")
+        row.operator(EGOP_ProfilerExport.bl_idname, text="Export")
+
+        tree = context.space_data.edit_tree
+        rows = [(node, stats) for node, stats in profiler.rows() if node.id_data == tree]
+        if not rows:
+            layout.label(text="Enable profiling in preferences and execute")
+            return
+
+        grid = layout.grid_flow(columns=4, even_columns=False, align=True)
+        for text in ("Node", "Calls", "Total ms", "Self ms"):
+            grid.label(text=text)
+
+        for node, stats in rows[:self.row_limit]:
+            grid.label(text=node.name)
+            grid.label(text=str(stats.calls))
+            grid.label(text=f"{stats.total * 1000:.2f}")
+            grid.label(text=f"{stats.own * 1000:.2f}")
+
+
+classes = [ EGPT_Profiler ]
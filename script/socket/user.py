@@ -18,6 +18,16 @@ class EGS_Reference(EG_Socket):
     
     socket_color = (0.71, 0.32, 1.0, 1.0)
 
+
+class EGS_ObjectHandle(EG_Socket):
+    """Object Handle Socket, stays valid when the object is renamed"""
+    
+    bl_idname = "egs_object_handle"
+    bl_label = "Object Handle"
+    
+    socket_color = (1.0, 0.45, 0.25, 1.0)
+
+
 class EGS_Modifier(EG_Socket):
     """Blender's Modifier Socket"""
     
@@ -29,5 +39,6 @@ class EGS_Modifier(EG_Socket):
 classes = [
     EGS_Object,
     EGS_Reference,
+    EGS_ObjectHandle,
     EGS_Modifier
 ]
\ No newline at end of file
@@ -0,0 +1,25 @@
+# Run with "python -m unittest" from the repository root, the add-on
+# package itself can't be imported by pytest outside of blender
+
+import os
+import sys
+
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+# Same stand-in bpy the benchmarks run against
+from benchmarks import fake_bpy
+bpy = fake_bpy.install()
+
+
+registered = False
+
+def register():
+    """Register the add-on once for every test module"""
+
+    global registered
+    if not registered:
+        from script import eg_app
+        eg_app.register()
+        registered = True
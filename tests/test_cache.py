@@ -0,0 +1,37 @@
+import unittest
+
+from tests import bpy
+from script.base.cache import EG_CacheStore
+
+
+class TestCacheStore(unittest.TestCase):
+
+    def test_clear_resets_stats(self):
+        store = EG_CacheStore()
+        store.set("a", list(range(100)))
+        store.set("b", "value", namespace="memo")
+        store.get("a")
+        store.get("missing")
+
+        store.clear()
+
+        namespaces, keys, _ = store.summary()
+        self.assertEqual(len(store), 0)
+        self.assertEqual(store.size, 0)
+        self.assertEqual(namespaces, {})
+        self.assertEqual(keys, [])
+
+    def test_clear_namespace_keeps_counters(self):
+        store = EG_CacheStore()
+        store.set("a", "value")
+        store.get("a")
+
+        store.clear("user")
+
+        namespaces, _, _ = store.summary()
+        self.assertEqual(namespaces["user"].size, 0)
+        self.assertEqual(namespaces["user"].hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
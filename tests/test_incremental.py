@@ -0,0 +1,92 @@
+import io
+import types
+import unittest
+import contextlib
+
+from . import bpy, register
+
+
+def execute(function):
+    from script.operator.exec_main import EGOP_ExecuteMain
+
+    context = type("Context", (), { "active_node": function })()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        EGOP_ExecuteMain().execute(context)
+        bpy.app.timers.run_all()
+    return output.getvalue().splitlines()
+
+
+def link(tree, from_node, from_name, to_node, to_name):
+    tree.links.new(from_node.outputs[from_name], to_node.inputs[to_name])
+
+
+class TestIncrementalRuns(unittest.TestCase):
+
+    def setUp(self):
+        register()
+
+        from script.base.library import get_preference
+        from script.base.incremental import flush_records
+        from script.base.tree import flush_changes
+
+        preference = get_preference()
+        self.previous = preference.incremental_runs
+        preference.incremental_runs = True
+        flush_records()
+        flush_changes()
+
+    def tearDown(self):
+        from script.base.library import get_preference
+        get_preference().incremental_runs = self.previous
+
+    def create_tree(self, name):
+        tree = bpy.data.node_groups.new(name, "eg_nodetree")
+        function = tree.nodes.new("egn_python_function")
+        return tree, function
+
+    def test_cache_set_every_run(self):
+        tree, function = self.create_tree("test_cache")
+
+        store = tree.nodes.new("egn_python_cache_set")
+        store.inputs["name"].default_value = "greeting"
+        store.inputs["value"].default_value = "hello"
+        link(tree, function, "exec", store, "exec")
+
+        read = tree.nodes.new("egn_python_cache_get")
+        read.inputs["name"].default_value = "greeting"
+
+        show = tree.nodes.new("egn_python_print")
+        link(tree, store, "exec", show, "exec")
+        link(tree, read, "value", show, "value")
+
+        self.assertIn("hello", execute(function))
+        self.assertIn("hello", execute(function))
+
+    def test_property_edit_reexecutes(self):
+        tree, function = self.create_tree("test_property")
+
+        select = tree.nodes.new("egn_object_select_all")
+        link(tree, function, "exec", select, "exec")
+
+        actions = []
+        previous = bpy.ops.__dict__.get("object")
+        bpy.ops.object = types.SimpleNamespace(select_all=lambda action: actions.append(action))
+        try:
+            execute(function)
+            execute(function)
+
+            # Edit without an update callback
+            select.prop_action = "INVERT"
+            execute(function)
+        finally:
+            if previous is None:
+                del bpy.ops.object
+            else:
+                bpy.ops.object = previous
+
+        self.assertEqual(actions, ["SELECT", "INVERT"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import types
+import unittest
+
+from . import bpy, register
+from .test_incremental import execute
+
+
+def create_update(obj, transform=False, geometry=False):
+    return types.SimpleNamespace(id=obj, is_updated_transform=transform, is_updated_geometry=geometry)
+
+
+def create_depsgraph(updates, kinds=("OBJECT",)):
+    return types.SimpleNamespace(updates=updates, id_type_updated=lambda kind: kind in kinds)
+
+
+class TestKeptObjectLists(unittest.TestCase):
+
+    def setUp(self):
+        register()
+
+        from script.base.cache import cache_store
+        cache_store.clear()
+
+        bpy.data.objects.clear()
+        for index in range(4):
+            bpy.data.objects.new(f"Object_{index}")
+
+        self.tree = bpy.data.node_groups.new("test_kept", "eg_nodetree")
+        self.function = self.tree.nodes.new("egn_python_function")
+        self.fetch = self.tree.nodes.new("egn_object_get_all")
+        self.tree.links.new(self.function.outputs["exec"], self.fetch.inputs["exec"])
+
+    def get_kept(self):
+        from script.base.library import get_kept_cache
+        return get_kept_cache(self.fetch, "object Ids")
+
+    def test_moving_keeps_list(self):
+        from script.eg_handler import on_depsgraph_update
+
+        execute(self.function)
+        kept = self.get_kept()
+        self.assertEqual(len(kept), 4)
+
+        moved = bpy.data.objects["Object_1"]
+        moved.location = (1.0, 2.0, 3.0)
+        on_depsgraph_update(None, create_depsgraph([create_update(moved, transform=True)]))
+
+        execute(self.function)
+        self.assertIs(self.get_kept(), kept)
+
+    def test_renaming_drops_list(self):
+        from script.eg_handler import on_depsgraph_update
+
+        execute(self.function)
+
+        renamed = bpy.data.objects["Object_1"]
+        renamed.name = "Renamed"
+        on_depsgraph_update(None, create_depsgraph([create_update(renamed)]))
+
+        self.assertIsNone(self.get_kept())
+        execute(self.function)
+        self.assertIn("Renamed", self.get_kept())
+
+
+if __name__ == "__main__":
+    unittest.main()